@@ -0,0 +1,218 @@
+"""
+Shared pytest fixtures for the Computational Broker Engine test suite
+"""
+
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+from pydantic import TypeAdapter
+
+import extract
+from extract import EXTRACTION_MODEL, SYSTEM_PROMPT, DiscoveryCallExtraction
+
+
+# Recorded extraction of transcript.txt, replayed instead of calling the API
+# when HARPER_USE_CACHED_EXTRACTION=1
+RECORDED_EXTRACTION_PATH = Path(__file__).parent / "fixtures" / "rusty_anchor.json"
+USE_RECORDED_EXTRACTION = os.getenv("HARPER_USE_CACHED_EXTRACTION") == "1"
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+@lru_cache(maxsize=1)
+def _transcript():
+    """Read transcript.txt once per process"""
+    return Path(__file__).with_name("transcript.txt").read_text()
+
+
+def _extraction_cache_key(transcript: str) -> str:
+    """Content address for an extraction: model, prompt and transcript, length-prefixed"""
+    digest = hashlib.sha256()
+    for part in (EXTRACTION_MODEL, SYSTEM_PROMPT, transcript):
+        data = part.encode()
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _recorded_extraction_json():
+    """Read the recorded extraction once per process"""
+    return RECORDED_EXTRACTION_PATH.read_bytes()
+
+
+def _recorded_extraction(transcript: str = "") -> DiscoveryCallExtraction:
+    """Stand-in for extract_from_transcript: a fresh copy of the recorded result"""
+    return DiscoveryCallExtraction.model_validate_json(_recorded_extraction_json())
+
+
+# Mocked extraction of transcript.txt shared by the unit-test modules
+_EXTRACTION_BLOB: dict = {
+    "business_entity": {
+        "legal_name": None,
+        "dba": "The Rusty Anchor",
+        "address": {
+            "street": "450 Maple Avenue",
+            "city": "Charleston",
+            "state": "South Carolina",
+            "zip_code": "29401",
+        },
+        "occupancy_type": "Leasing",
+    },
+    "industry_classification": {
+        "naics_code": "722410",
+        "sic_code": "5813",
+        "business_description": "Tavern focusing on high-end cocktails with piano entertainment",
+    },
+    "revenue_details": {
+        "gross_annual_sales": 850000.0,
+        "alcohol_percentage": 70.0,
+        "food_percentage": 30.0,
+    },
+    "risk_factors": {
+        "hazards": ["live entertainment", "alcohol service"],
+        "operating_hours": None,
+        "special_features": ["high-end cocktails"],
+    },
+    "insurance_history": {
+        "past_carrier": "Geico",
+        "past_carrier_context": "personal",
+        "current_need": "specialized business policy",
+        "urgency": "ASAP",
+    },
+    "social_context": {
+        "availability_notes": "Unavailable until 1:00 PM Tuesday",
+        "preferred_contact_time": "Tuesday afternoon",
+        "personal_constraints": "daughter's dentist appointment",
+        "contact_restrictions": "Don't call tomorrow morning",
+    },
+}
+
+_EXTRACTION_ADAPTER = TypeAdapter(DiscoveryCallExtraction)
+
+
+def _build_extraction(**risk_factors) -> DiscoveryCallExtraction:
+    """Validate _EXTRACTION_BLOB, overriding the given risk_factors fields (e.g. hazards)"""
+    blob = {**_EXTRACTION_BLOB, "risk_factors": {**_EXTRACTION_BLOB["risk_factors"], **risk_factors}}
+    return _EXTRACTION_ADAPTER.validate_python(blob)
+
+
+def _shared_across_workers(tmp_path_factory, name, produce):
+    """
+    Compute a text value once per test run and share it across xdist workers.
+
+    Without xdist this simply calls produce(). Under `pytest -n`, the first
+    worker to take the lock writes the value next to the per-worker temp
+    directories and every other worker reads it back instead of recomputing.
+    """
+    if not os.environ.get("PYTEST_XDIST_WORKER"):
+        return produce()
+
+    from filelock import FileLock
+
+    path = tmp_path_factory.getbasetemp().parent / name
+    with FileLock(f"{path}.lock"):
+        if not path.is_file():
+            path.write_text(produce())
+        return path.read_text()
+
+
+# =============================================================================
+# COLLECTION
+# =============================================================================
+
+# Test classes that call the real OpenAI API; each is also marked `serial`
+API_TEST_CLASSES = frozenset({
+    "TestIntegrationWithAPI",
+    "TestIntegrationEndToEnd",
+    "TestFullPipelineIntegration",
+    "TestIntegrationPipeline",
+})
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Deselect the real-API test classes when OPENAI_API_KEY is not set (unless
+    the recorded extraction is replayed), and pin `serial`-marked tests to a
+    single xdist worker.
+    """
+    if not (os.getenv("OPENAI_API_KEY") or USE_RECORDED_EXTRACTION):
+        kept, deselected = [], []
+        for item in items:
+            cls = getattr(item, "cls", None)
+            (deselected if cls is not None and cls.__name__ in API_TEST_CLASSES else kept).append(item)
+
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = kept
+
+    # Under `pytest -n ... --dist loadgroup` every serial test lands on one worker
+    if config.pluginmanager.hasplugin("xdist"):
+        for item in items:
+            if item.get_closest_marker("serial"):
+                item.add_marker(pytest.mark.xdist_group("serial"))
+
+
+# =============================================================================
+# TEST SETUP
+# =============================================================================
+
+@pytest.fixture(autouse=True)
+def _replay_recorded_extraction(request, monkeypatch):
+    """
+    With HARPER_USE_CACHED_EXTRACTION=1, integration tests get the recorded
+    extraction instead of an API call. Mocked unit tests keep the real function.
+    """
+    if not USE_RECORDED_EXTRACTION or not request.node.get_closest_marker("integration"):
+        return
+
+    original = extract.extract_from_transcript
+    monkeypatch.setattr(extract, "extract_from_transcript", _recorded_extraction)
+    # Test modules that did `from extract import extract_from_transcript`
+    if getattr(request.module, "extract_from_transcript", None) is original:
+        monkeypatch.setattr(request.module, "extract_from_transcript", _recorded_extraction)
+
+
+# =============================================================================
+# SHARED FIXTURES
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def build_extraction():
+    """Builder for the mocked Rusty Anchor extraction; keyword args override risk_factors fields"""
+    return _build_extraction
+
+
+@pytest.fixture(scope="session")
+def sample_transcript(tmp_path_factory):
+    """The actual transcript.txt, shared by every test module and xdist worker"""
+    return _shared_across_workers(tmp_path_factory, "transcript.cache", _transcript)
+
+
+@pytest.fixture(scope="session")
+def cached_extraction(request, sample_transcript):
+    """
+    Real API extraction of sample_transcript, cached on disk by content.
+
+    Results live under .pytest_cache keyed on (model, system prompt, transcript),
+    so editing any of them triggers a fresh API call. Use --cache-clear to force one.
+    With HARPER_USE_CACHED_EXTRACTION=1, or when the cache plugin is disabled
+    (-p no:cacheprovider), the recorded extraction is used instead.
+    """
+    if USE_RECORDED_EXTRACTION or getattr(request.config, "cache", None) is None:
+        return _recorded_extraction(sample_transcript)
+
+    path = request.config.cache.mkdir("extractions") / f"{_extraction_cache_key(sample_transcript)}.json"
+    if path.is_file():
+        return DiscoveryCallExtraction.model_validate_json(path.read_bytes())
+
+    from extract import extract_from_transcript
+
+    result = extract_from_transcript(sample_transcript)
+    path.write_text(result.model_dump_json())
+    return result
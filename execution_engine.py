@@ -334,6 +334,10 @@ class ExecutiveSummary(BaseModel):
     )
 
 
+# Hazard wording worth calling out in the business snapshot (substring match)
+ENTERTAINMENT_HAZARD_PATTERN = re.compile(r"piano|music|band|entertainment|live", re.IGNORECASE)
+
+
 class ExecutiveSummaryGenerator:
     """Generates 'Speed of Thought' executive summaries"""
 
@@ -441,8 +445,7 @@ class ExecutiveSummaryGenerator:
         if extraction.risk_factors.hazards:
             # Look for entertainment-related hazards
             for hazard in extraction.risk_factors.hazards:
-                hazard_lower = hazard.lower()
-                if any(word in hazard_lower for word in ['piano', 'music', 'band', 'entertainment', 'live']):
+                if ENTERTAINMENT_HAZARD_PATTERN.search(hazard):
                     special_features.append(hazard)
                     break
 
@@ -7,8 +7,6 @@ import os
 import json
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
-import openai
-import instructor
 
 # Load environment variables from .env file
 load_dotenv()
@@ -93,14 +91,9 @@ class DiscoveryCallExtraction(BaseModel):
 
 # --- Extraction Logic ---
 
-def extract_from_transcript(transcript: str) -> DiscoveryCallExtraction:
-    """
-    Process a discovery call transcript and extract structured data.
-    Uses OpenAI with Instructor for structured output validation.
-    """
-    client = instructor.from_openai(openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY")))
+EXTRACTION_MODEL = "gpt-4o"
 
-    system_prompt = """You are an expert insurance data extraction agent for the "Computational Broker" system.
+SYSTEM_PROMPT = """You are an expert insurance data extraction agent for the "Computational Broker" system.
 
 Your task is to extract structured data from discovery call transcripts with these critical requirements:
 
@@ -129,11 +122,23 @@ Your task is to extract structured data from discovery call transcripts with the
 
 Be precise. Never hallucinate data not present in the transcript. Leave fields null if not mentioned."""
 
+
+def extract_from_transcript(transcript: str) -> DiscoveryCallExtraction:
+    """
+    Process a discovery call transcript and extract structured data.
+    Uses OpenAI with Instructor for structured output validation.
+    """
+    # Deferred so schema-only imports of this module never load the API clients
+    import openai
+    import instructor
+
+    client = instructor.from_openai(openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY")))
+
     extraction = client.chat.completions.create(
-        model="gpt-4o",
+        model=EXTRACTION_MODEL,
         response_model=DiscoveryCallExtraction,
         messages=[
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": f"Extract structured data from this discovery call transcript:\n\n{transcript}"}
         ]
     )
@@ -8,8 +8,10 @@ Key Principles:
 - Strict schema adherence: Mirrors actual Accord form field structure
 """
 
+import re
 from datetime import date
 from enum import Enum
+from types import MappingProxyType
 from pydantic import BaseModel, Field
 from typing import Optional
 
@@ -254,6 +256,24 @@ REQUIRED_FIELDS_126 = {
     "liquor_liability.food_sales_percentage": ("medium", "What percentage of sales is from food?"),
 }
 
+# Exact (lowercased) occupancy wordings; anything else falls back to substring checks
+OCCUPANCY_MAP = MappingProxyType({
+    "leasing": PremisesOccupancy.TENANT,
+    "lease": PremisesOccupancy.TENANT,
+    "tenant": PremisesOccupancy.TENANT,
+    "renting": PremisesOccupancy.TENANT,
+    "rent": PremisesOccupancy.TENANT,
+    "owning": PremisesOccupancy.OWNER,
+    "own": PremisesOccupancy.OWNER,
+    "owner": PremisesOccupancy.OWNER,
+})
+
+# Hazard wording that signals live entertainment exposure (substring match)
+ENTERTAINMENT_PATTERN = re.compile(r"piano|music|band|dj|entertainment|live", re.IGNORECASE)
+
+# Operating-hours wording that signals late-night operations (substring match)
+LATE_NIGHT_PATTERN = re.compile(r"1 am|2 am|3 am|midnight|1am|2am", re.IGNORECASE)
+
 
 class FormMapper:
     """
@@ -311,11 +331,14 @@ class FormMapper:
 
         # Map occupancy type
         if ext.business_entity.occupancy_type:
-            occ = ext.business_entity.occupancy_type.lower()
-            if "leas" in occ or "tenant" in occ or "rent" in occ:
-                form.premises.occupancy = PremisesOccupancy.TENANT
-            elif "own" in occ:
-                form.premises.occupancy = PremisesOccupancy.OWNER
+            occ = ext.business_entity.occupancy_type.strip().lower()
+            occupancy = OCCUPANCY_MAP.get(occ)
+            if occupancy is None:
+                if "leas" in occ or "tenant" in occ or "rent" in occ:
+                    occupancy = PremisesOccupancy.TENANT
+                elif "own" in occ:
+                    occupancy = PremisesOccupancy.OWNER
+            form.premises.occupancy = occupancy
 
         # Section 4: Business Info
         if ext.industry_classification:
@@ -361,16 +384,11 @@ class FormMapper:
         if ext.risk_factors:
             hazards_lower = [h.lower() for h in ext.risk_factors.hazards]
 
-            # Check for live entertainment
-            entertainment_keywords = ["piano", "music", "band", "dj", "entertainment", "live"]
-            for keyword in entertainment_keywords:
-                if any(keyword in h for h in hazards_lower):
+            # Check for live entertainment, keeping the first matching hazard as the description
+            for h in ext.risk_factors.hazards:
+                if ENTERTAINMENT_PATTERN.search(h):
                     form.entertainment.live_entertainment = True
-                    # Find the specific entertainment description
-                    for h in ext.risk_factors.hazards:
-                        if any(kw in h.lower() for kw in entertainment_keywords):
-                            form.entertainment.entertainment_description = h
-                            break
+                    form.entertainment.entertainment_description = h
                     break
 
             # Check for other entertainment hazards
@@ -400,8 +418,7 @@ class FormMapper:
         if ext.risk_factors and ext.risk_factors.operating_hours:
             form.hours.opening_time = ext.risk_factors.operating_hours
             # Check for late night
-            hours = ext.risk_factors.operating_hours.lower()
-            if any(late in hours for late in ["1 am", "2 am", "3 am", "midnight", "1am", "2am"]):
+            if LATE_NIGHT_PATTERN.search(ext.risk_factors.operating_hours):
                 form.hours.late_night_operations = True
 
     def _generate_broker_tasks(self):
@@ -444,27 +461,29 @@ class FormMapper:
         form_125 = self.output.accord_125
         form_126 = self.output.accord_126
 
+        # Sections hold only flat fields, so read attributes directly rather
+        # than building a model_dump() dict per section
+
         # Count populated vs missing in Accord 125
         populated_125 = 0
         total_125 = 0
-        for section_name in ["applicant", "contact", "premises", "business", "revenue", "prior_insurance"]:
+        for section_name in ("applicant", "contact", "premises", "business", "revenue", "prior_insurance"):
             section = getattr(form_125, section_name)
-            for field_name, value in section.model_dump().items():
-                if not field_name.startswith("_"):
-                    total_125 += 1
-                    if value is not None:
-                        populated_125 += 1
+            for field_name in type(section).model_fields:
+                total_125 += 1
+                if getattr(section, field_name) is not None:
+                    populated_125 += 1
 
         # Count populated in Accord 126
         populated_126 = 0
         total_126 = 0
-        for section_name in ["classification", "liquor_liability", "entertainment", "hazards", "hours"]:
+        for section_name in ("classification", "liquor_liability", "entertainment", "hazards", "hours"):
             section = getattr(form_126, section_name)
-            for field_name, value in section.model_dump().items():
-                if not field_name.startswith("_"):
-                    total_126 += 1
-                    if value is not None and value != [] and value != False:
-                        populated_126 += 1
+            for field_name in type(section).model_fields:
+                total_126 += 1
+                value = getattr(section, field_name)
+                if value is not None and value != [] and value != False:
+                    populated_126 += 1
 
         self.output.mapping_summary = {
             "accord_125": {
@@ -6,11 +6,21 @@ insurance submissions to the most suitable underwriters based on multiple
 weighted scoring criteria.
 """
 
-from typing import Optional
-from pydantic import BaseModel, Field
+import heapq
+import sys
+from functools import lru_cache
+from typing import Optional, Sequence
+from pydantic import BaseModel, Field, field_validator
 
 from form_mapper import MappedFormOutput
-from underwriter_db import Underwriter, get_all_underwriters
+from underwriter_db import (
+    Region,
+    Underwriter,
+    UnderwriterColumns,
+    Workload,
+    build_underwriter_soa,
+    get_underwriter_columns,
+)
 
 
 # =============================================================================
@@ -36,9 +46,9 @@ class RiskProfile(BaseModel):
         default=None,
         description="Geographic region of the business (e.g., Southeast, Northeast)"
     )
-    hazards: list[str] = Field(
-        default_factory=list,
-        description="List of identified hazards (e.g., cooking equipment, alcohol service)"
+    hazards: frozenset[str] = Field(
+        default_factory=frozenset,
+        description="Lowercased set of identified hazards (e.g., cooking equipment, alcohol service)"
     )
     liquor_liability: bool = Field(
         default=False,
@@ -57,6 +67,12 @@ class RiskProfile(BaseModel):
         description="Annual revenue for sizing the risk"
     )
 
+    @field_validator("hazards", mode="after")
+    @classmethod
+    def _lowercase_hazards(cls, hazards: frozenset[str]) -> frozenset[str]:
+        """Lowercase hazards so the aversion lookups always compare like with like."""
+        return frozenset(h.lower() for h in hazards)
+
 
 class UnderwriterScore(BaseModel):
     """
@@ -103,6 +119,143 @@ class RoutingRecommendation(BaseModel):
         arbitrary_types_allowed = True
 
 
+# =============================================================================
+# Region Lookup
+# =============================================================================
+
+# Map full state names to abbreviations
+STATE_ALIASES = {
+    'ALABAMA': 'AL', 'ALASKA': 'AK', 'ARIZONA': 'AZ', 'ARKANSAS': 'AR',
+    'CALIFORNIA': 'CA', 'COLORADO': 'CO', 'CONNECTICUT': 'CT', 'DELAWARE': 'DE',
+    'FLORIDA': 'FL', 'GEORGIA': 'GA', 'HAWAII': 'HI', 'IDAHO': 'ID',
+    'ILLINOIS': 'IL', 'INDIANA': 'IN', 'IOWA': 'IA', 'KANSAS': 'KS',
+    'KENTUCKY': 'KY', 'LOUISIANA': 'LA', 'MAINE': 'ME', 'MARYLAND': 'MD',
+    'MASSACHUSETTS': 'MA', 'MICHIGAN': 'MI', 'MINNESOTA': 'MN', 'MISSISSIPPI': 'MS',
+    'MISSOURI': 'MO', 'MONTANA': 'MT', 'NEBRASKA': 'NE', 'NEVADA': 'NV',
+    'NEW HAMPSHIRE': 'NH', 'NEW JERSEY': 'NJ', 'NEW MEXICO': 'NM', 'NEW YORK': 'NY',
+    'NORTH CAROLINA': 'NC', 'NORTH DAKOTA': 'ND', 'OHIO': 'OH', 'OKLAHOMA': 'OK',
+    'OREGON': 'OR', 'PENNSYLVANIA': 'PA', 'RHODE ISLAND': 'RI', 'SOUTH CAROLINA': 'SC',
+    'SOUTH DAKOTA': 'SD', 'TENNESSEE': 'TN', 'TEXAS': 'TX', 'UTAH': 'UT',
+    'VERMONT': 'VT', 'VIRGINIA': 'VA', 'WASHINGTON': 'WA', 'WEST VIRGINIA': 'WV',
+    'WISCONSIN': 'WI', 'WYOMING': 'WY'
+}
+
+REGION_STATES = {
+    'Northeast': ['ME', 'NH', 'VT', 'MA', 'RI', 'CT', 'NY', 'NJ', 'PA'],
+    'Southeast': ['DE', 'MD', 'VA', 'WV', 'NC', 'SC', 'GA', 'FL', 'KY', 'TN', 'AL', 'MS', 'AR', 'LA'],
+    'Midwest': ['OH', 'MI', 'IN', 'IL', 'WI', 'MN', 'IA', 'MO', 'ND', 'SD', 'NE', 'KS'],
+    'Southwest': ['TX', 'OK', 'NM', 'AZ'],
+    'West': ['CO', 'WY', 'MT', 'ID', 'UT', 'NV', 'CA', 'OR', 'WA', 'AK', 'HI']
+}
+
+# Inverted once so region lookup is a single hash probe
+STATE_TO_REGION = {
+    abbrev: region
+    for region, states in REGION_STATES.items()
+    for abbrev in states
+}
+
+REGION_ADJACENCY = {
+    'Northeast': ['Southeast', 'Midwest'],
+    'Southeast': ['Northeast', 'Midwest', 'Southwest'],
+    'Midwest': ['Northeast', 'Southeast', 'Southwest', 'West'],
+    'Southwest': ['Southeast', 'Midwest', 'West'],
+    'West': ['Midwest', 'Southwest']
+}
+
+# One bit per underwriter region, so region matching is a pair of bitwise ANDs
+REGION_BITS = {region.value: 1 << i for i, region in enumerate(Region)}
+
+# Bitmask of the regions adjacent to each region
+ADJACENT_REGION_MASKS = {
+    region: sum(REGION_BITS[adjacent] for adjacent in adjacent_regions)
+    for region, adjacent_regions in REGION_ADJACENCY.items()
+}
+
+
+# =============================================================================
+# NAICS Classification
+# =============================================================================
+
+# NAICS-based classification
+NAICS_CLASSIFICATIONS = {
+    '722410': 'bar',  # Drinking Places (Alcoholic Beverages)
+    '722511': 'restaurant',  # Full-Service Restaurants
+    '722513': 'restaurant',  # Limited-Service Restaurants
+    '722514': 'restaurant',  # Cafeterias
+    '722515': 'restaurant',  # Snack and Nonalcoholic Beverage Bars
+    '445110': 'retail',  # Supermarkets
+    '445120': 'retail',  # Convenience Stores
+    '448110': 'retail',  # Men's Clothing Stores
+    '448120': 'retail',  # Women's Clothing Stores
+    '721110': 'hotel',  # Hotels
+    '721120': 'hotel',  # Casino Hotels
+}
+
+# Fallback classification on the first 4 digits
+NAICS_PREFIX_CLASSIFICATIONS = {
+    '7224': 'bar',
+    '7225': 'restaurant',
+    '4451': 'retail',
+    '4481': 'retail',
+    '7211': 'hotel',
+}
+
+
+@lru_cache(maxsize=256)
+def classify_naics(naics_code: str) -> Optional[str]:
+    """
+    Resolve a NAICS code to a business type (e.g., 'bar', 'restaurant').
+
+    Results are memoized since the same handful of codes recur across
+    submissions.
+
+    Args:
+        naics_code: NAICS code string
+
+    Returns:
+        Business type classification, or None if the code is unknown
+    """
+    # Check exact match first
+    if naics_code in NAICS_CLASSIFICATIONS:
+        return NAICS_CLASSIFICATIONS[naics_code]
+
+    # Check prefix match (first 4 digits)
+    return NAICS_PREFIX_CLASSIFICATIONS.get(naics_code[:4])
+
+
+# Specialty credit by shared NAICS prefix length, longest first
+# (6 = exact national industry, 4 = same industry group)
+NAICS_PREFIX_CREDIT = ((6, 1.0), (4, 0.7))
+
+
+@lru_cache(maxsize=8)
+def naics_prefix_masks(
+    naics_specialties: tuple[tuple[str, ...], ...]
+) -> dict[tuple[int, str], int]:
+    """
+    Index a column of specialty codes by each credited prefix.
+
+    Each (length, prefix) pair for the 4- and 6-digit prefixes maps to a
+    bitmask of the rows holding a specialty with that prefix, so one lookup
+    per prefix length finds every matching underwriter.
+
+    Args:
+        naics_specialties: Specialty codes per underwriter, in row order
+
+    Returns:
+        (length, prefix) to row bitmask
+    """
+    masks: dict[tuple[int, str], int] = {}
+    for row, codes in enumerate(naics_specialties):
+        bit = 1 << row
+        for code in codes:
+            for length, _ in NAICS_PREFIX_CREDIT:
+                key = (length, code[:length])
+                masks[key] = masks.get(key, 0) | bit
+    return masks
+
+
 # =============================================================================
 # Routing Engine
 # =============================================================================
@@ -115,7 +268,7 @@ class RoutingEngine:
     against the risk profile extracted from a submission. Scoring criteria
     include:
 
-    - Region match (25 points): Exact geographic match
+    - Region match (25 points): Exact geographic match, half for adjacent regions
     - NAICS specialty (30 points): Underwriter specializes in the industry
     - Risk appetite (20 points): Underwriter preference for business type
     - Risk aversion penalty (-50 points): Underwriter avoids this type
@@ -149,9 +302,18 @@ class RoutingEngine:
     WORKLOAD_LOW = 0.5  # Less than 50% capacity
     WORKLOAD_HIGH = 0.85  # More than 85% capacity
 
-    def __init__(self):
-        """Initialize the routing engine."""
-        self._underwriters: list[Underwriter] = []
+    def __init__(self, underwriters: Optional[Sequence[Underwriter]] = None):
+        """
+        Initialize the routing engine.
+
+        Args:
+            underwriters: Panel to route against. Defaults to the full
+                underwriter database.
+        """
+        # Column view of an injected panel; None means the shared database view
+        self._columns: Optional[UnderwriterColumns] = (
+            build_underwriter_soa(underwriters) if underwriters is not None else None
+        )
 
     def extract_risk_profile(self, mapped_output: MappedFormOutput) -> RiskProfile:
         """
@@ -170,6 +332,9 @@ class RoutingEngine:
         naics_code = None
         if mapped_output.accord_125 and mapped_output.accord_125.business:
             naics_code = mapped_output.accord_125.business.naics_code
+            if naics_code:
+                # Same object as the interned specialty codes, so set probes compare by identity
+                naics_code = sys.intern(naics_code)
 
         # Extract region from premises location
         region = None
@@ -178,23 +343,22 @@ class RoutingEngine:
             if state:
                 region = self._determine_region(state)
 
-        # Extract hazards from Accord 126
-        hazards = []
+        # Extract hazards from Accord 126, lowercased for set lookups
+        hazards = set()
         if mapped_output.accord_126 and mapped_output.accord_126.hazards:
-            hazards = mapped_output.accord_126.hazards.hazards.copy()
+            hazards = {h.lower() for h in mapped_output.accord_126.hazards.hazards}
 
         # Check for liquor liability
         liquor_liability = False
         if mapped_output.accord_126 and mapped_output.accord_126.liquor_liability:
             liquor_liability = mapped_output.accord_126.liquor_liability.liquor_liability_required
-            if liquor_liability and "alcohol_service" not in hazards:
-                hazards.append("alcohol_service")
+            if liquor_liability:
+                hazards.add("alcohol_service")
 
         # Check for entertainment hazards
         if mapped_output.accord_126 and mapped_output.accord_126.entertainment:
             if mapped_output.accord_126.entertainment.live_entertainment:
-                if "live_entertainment" not in hazards:
-                    hazards.append("live_entertainment")
+                hazards.add("live_entertainment")
 
         # Determine business type from NAICS or description
         business_type = self._classify_business_type(naics_code, mapped_output)
@@ -210,7 +374,7 @@ class RoutingEngine:
         return RiskProfile(
             naics_code=naics_code,
             region=region,
-            hazards=hazards,
+            hazards=frozenset(hazards),
             liquor_liability=liquor_liability,
             urgency=urgency,
             business_type=business_type,
@@ -232,40 +396,10 @@ class RoutingEngine:
 
         state_upper = state.upper().strip()
 
-        # Map full state names to abbreviations
-        state_name_to_abbrev = {
-            'ALABAMA': 'AL', 'ALASKA': 'AK', 'ARIZONA': 'AZ', 'ARKANSAS': 'AR',
-            'CALIFORNIA': 'CA', 'COLORADO': 'CO', 'CONNECTICUT': 'CT', 'DELAWARE': 'DE',
-            'FLORIDA': 'FL', 'GEORGIA': 'GA', 'HAWAII': 'HI', 'IDAHO': 'ID',
-            'ILLINOIS': 'IL', 'INDIANA': 'IN', 'IOWA': 'IA', 'KANSAS': 'KS',
-            'KENTUCKY': 'KY', 'LOUISIANA': 'LA', 'MAINE': 'ME', 'MARYLAND': 'MD',
-            'MASSACHUSETTS': 'MA', 'MICHIGAN': 'MI', 'MINNESOTA': 'MN', 'MISSISSIPPI': 'MS',
-            'MISSOURI': 'MO', 'MONTANA': 'MT', 'NEBRASKA': 'NE', 'NEVADA': 'NV',
-            'NEW HAMPSHIRE': 'NH', 'NEW JERSEY': 'NJ', 'NEW MEXICO': 'NM', 'NEW YORK': 'NY',
-            'NORTH CAROLINA': 'NC', 'NORTH DAKOTA': 'ND', 'OHIO': 'OH', 'OKLAHOMA': 'OK',
-            'OREGON': 'OR', 'PENNSYLVANIA': 'PA', 'RHODE ISLAND': 'RI', 'SOUTH CAROLINA': 'SC',
-            'SOUTH DAKOTA': 'SD', 'TENNESSEE': 'TN', 'TEXAS': 'TX', 'UTAH': 'UT',
-            'VERMONT': 'VT', 'VIRGINIA': 'VA', 'WASHINGTON': 'WA', 'WEST VIRGINIA': 'WV',
-            'WISCONSIN': 'WI', 'WYOMING': 'WY'
-        }
-
         # Convert full name to abbreviation if needed
-        if state_upper in state_name_to_abbrev:
-            state_upper = state_name_to_abbrev[state_upper]
-
-        region_mapping = {
-            'Northeast': ['ME', 'NH', 'VT', 'MA', 'RI', 'CT', 'NY', 'NJ', 'PA'],
-            'Southeast': ['DE', 'MD', 'VA', 'WV', 'NC', 'SC', 'GA', 'FL', 'KY', 'TN', 'AL', 'MS', 'AR', 'LA'],
-            'Midwest': ['OH', 'MI', 'IN', 'IL', 'WI', 'MN', 'IA', 'MO', 'ND', 'SD', 'NE', 'KS'],
-            'Southwest': ['TX', 'OK', 'NM', 'AZ'],
-            'West': ['CO', 'WY', 'MT', 'ID', 'UT', 'NV', 'CA', 'OR', 'WA', 'AK', 'HI']
-        }
+        state_upper = STATE_ALIASES.get(state_upper, state_upper)
 
-        for region, states in region_mapping.items():
-            if state_upper in states:
-                return region
-
-        return None
+        return STATE_TO_REGION.get(state_upper)
 
     def _classify_business_type(
         self,
@@ -285,39 +419,7 @@ class RoutingEngine:
         if not naics_code:
             return None
 
-        # NAICS-based classification
-        naics_classifications = {
-            '722410': 'bar',  # Drinking Places (Alcoholic Beverages)
-            '722511': 'restaurant',  # Full-Service Restaurants
-            '722513': 'restaurant',  # Limited-Service Restaurants
-            '722514': 'restaurant',  # Cafeterias
-            '722515': 'restaurant',  # Snack and Nonalcoholic Beverage Bars
-            '445110': 'retail',  # Supermarkets
-            '445120': 'retail',  # Convenience Stores
-            '448110': 'retail',  # Men's Clothing Stores
-            '448120': 'retail',  # Women's Clothing Stores
-            '721110': 'hotel',  # Hotels
-            '721120': 'hotel',  # Casino Hotels
-        }
-
-        # Check exact match first
-        if naics_code in naics_classifications:
-            return naics_classifications[naics_code]
-
-        # Check prefix match (first 4 digits)
-        naics_prefix = naics_code[:4] if len(naics_code) >= 4 else naics_code
-        prefix_classifications = {
-            '7224': 'bar',
-            '7225': 'restaurant',
-            '4451': 'retail',
-            '4481': 'retail',
-            '7211': 'hotel',
-        }
-
-        if naics_prefix in prefix_classifications:
-            return prefix_classifications[naics_prefix]
-
-        return None
+        return classify_naics(naics_code)
 
     def score_underwriter(
         self,
@@ -382,31 +484,30 @@ class RoutingEngine:
         risk_profile: RiskProfile
     ) -> float:
         """Score based on region match."""
-        if not risk_profile.region:
+        if not hasattr(underwriter, 'region'):
+            return 0.0
+        return self._region_points(underwriter.region, risk_profile.region)
+
+    def _region_points(self, uw_region: Region | str, profile_region: Optional[str]) -> float:
+        """Region points for a single underwriter region value."""
+        if not profile_region or not uw_region:
             return 0.0
 
+        uw_bit = REGION_BITS.get(getattr(uw_region, 'value', uw_region), 0)
+
         # Check if underwriter serves this region
-        if hasattr(underwriter, 'regions') and underwriter.regions:
-            if risk_profile.region in underwriter.regions:
-                return self.REGION_MATCH_POINTS
-            # Partial credit for adjacent regions
-            adjacent_regions = self._get_adjacent_regions(risk_profile.region)
-            for region in underwriter.regions:
-                if region in adjacent_regions:
-                    return self.REGION_MATCH_POINTS * 0.5
+        if uw_bit & REGION_BITS.get(profile_region, 0):
+            return self.REGION_MATCH_POINTS
+
+        # Partial credit for adjacent regions
+        if uw_bit & ADJACENT_REGION_MASKS.get(profile_region, 0):
+            return self.REGION_MATCH_POINTS * 0.5
 
         return 0.0
 
     def _get_adjacent_regions(self, region: str) -> list[str]:
         """Get regions adjacent to the given region."""
-        adjacency = {
-            'Northeast': ['Southeast', 'Midwest'],
-            'Southeast': ['Northeast', 'Midwest', 'Southwest'],
-            'Midwest': ['Northeast', 'Southeast', 'Southwest', 'West'],
-            'Southwest': ['Southeast', 'Midwest', 'West'],
-            'West': ['Midwest', 'Southwest']
-        }
-        return adjacency.get(region, [])
+        return REGION_ADJACENCY.get(region, [])
 
     def _score_naics_specialty(
         self,
@@ -414,23 +515,53 @@ class RoutingEngine:
         risk_profile: RiskProfile
     ) -> float:
         """Score based on NAICS code specialty."""
-        if not risk_profile.naics_code:
+        if not hasattr(underwriter, 'naics_specialties'):
+            return 0.0
+        return self._naics_points(underwriter._naics_set, risk_profile.naics_code)
+
+    def _naics_points(self, specialties, naics_code: Optional[str]) -> float:
+        """NAICS points for a single underwriter's specialty codes."""
+        if not naics_code or not specialties:
             return 0.0
 
-        # Check if underwriter specializes in this NAICS
-        if hasattr(underwriter, 'naics_specialties') and underwriter.naics_specialties:
-            # Exact match
-            if risk_profile.naics_code in underwriter.naics_specialties:
-                return self.NAICS_SPECIALTY_POINTS
+        # Exact match
+        if naics_code in specialties:
+            return self.NAICS_SPECIALTY_POINTS
 
-            # Prefix match (same industry group)
-            naics_prefix = risk_profile.naics_code[:4]
-            for specialty in underwriter.naics_specialties:
-                if specialty.startswith(naics_prefix):
-                    return self.NAICS_SPECIALTY_POINTS * 0.7
+        # Prefix match (same industry group)
+        naics_prefix = naics_code[:4]
+        for specialty in specialties:
+            if specialty.startswith(naics_prefix):
+                return self.NAICS_SPECIALTY_POINTS * 0.7
 
         return 0.0
 
+    def _naics_column_points(
+        self,
+        naics_specialties: tuple[tuple[str, ...], ...],
+        naics_code: Optional[str]
+    ) -> list[float]:
+        """NAICS points for every row of a specialty column via the prefix masks."""
+        points = [0.0] * len(naics_specialties)
+        if not naics_code:
+            return points
+
+        # The masks cover 4- to 6-digit codes; anything else is compared row by row
+        if not 4 <= len(naics_code) <= 6:
+            return [self._naics_points(codes, naics_code) for codes in naics_specialties]
+
+        masks = naics_prefix_masks(naics_specialties)
+        scored = 0
+        for length, credit in NAICS_PREFIX_CREDIT:
+            # Rows already credited at a longer prefix keep that credit
+            mask = masks.get((length, naics_code[:length]), 0) & ~scored
+            scored |= mask
+            while mask:
+                low = mask & -mask
+                points[low.bit_length() - 1] = self.NAICS_SPECIALTY_POINTS * credit
+                mask ^= low
+        return points
+
     def _score_risk_appetite(
         self,
         underwriter: Underwriter,
@@ -442,23 +573,42 @@ class RoutingEngine:
         Returns positive points if underwriter likes this type,
         or negative penalty if they avoid it.
         """
+        return self._appetite_points(
+            getattr(underwriter, 'risk_appetite', None),
+            getattr(underwriter, 'risk_aversions', None),
+            getattr(underwriter, '_aversions_lc', frozenset()),
+            risk_profile
+        )
+
+    def _appetite_points(
+        self,
+        appetite,
+        aversions,
+        aversions_lc: frozenset[str],
+        risk_profile: RiskProfile
+    ) -> float:
+        """
+        Appetite points or aversion penalty for a single underwriter's risk lists.
+
+        aversions_lc is the underwriter's precomputed lowercased aversion set,
+        matched against the already lowercased profile hazards.
+        """
         if not risk_profile.business_type:
             return 0.0
 
         # Check risk appetite (what they like)
-        if hasattr(underwriter, 'risk_appetite') and underwriter.risk_appetite:
-            if risk_profile.business_type in underwriter.risk_appetite:
+        if appetite:
+            if risk_profile.business_type in appetite:
                 return self.RISK_APPETITE_POINTS
 
         # Check risk aversions (what they avoid)
-        if hasattr(underwriter, 'risk_aversions') and underwriter.risk_aversions:
-            if risk_profile.business_type in underwriter.risk_aversions:
+        if aversions:
+            if risk_profile.business_type in aversions:
                 return self.RISK_AVERSION_PENALTY
 
             # Check for specific hazard aversions
-            for hazard in risk_profile.hazards:
-                if hazard in underwriter.risk_aversions:
-                    return self.RISK_AVERSION_PENALTY
+            if not risk_profile.hazards.isdisjoint(aversions_lc):
+                return self.RISK_AVERSION_PENALTY
 
         return 0.0
 
@@ -470,14 +620,15 @@ class RoutingEngine:
         """Score based on average turnaround time."""
         if not hasattr(underwriter, 'avg_turnaround_days'):
             return 0.0
+        return self._turnaround_points(underwriter.avg_turnaround_days, risk_profile.urgency)
 
-        turnaround = underwriter.avg_turnaround_days
-
+    def _turnaround_points(self, turnaround: float, urgency: str) -> float:
+        """Turnaround points for a single average turnaround value."""
         # Apply urgency multiplier
         urgency_multiplier = 1.0
-        if risk_profile.urgency == 'rush':
+        if urgency == 'rush':
             urgency_multiplier = 1.5  # Rush submissions weight turnaround more
-        elif risk_profile.urgency == 'flexible':
+        elif urgency == 'flexible':
             urgency_multiplier = 0.5  # Flexible submissions care less
 
         # Calculate score based on turnaround
@@ -496,20 +647,23 @@ class RoutingEngine:
         """Score based on historical acceptance rate."""
         if not hasattr(underwriter, 'acceptance_rate'):
             return 0.0
+        return self._acceptance_points(underwriter.acceptance_rate)
 
+    def _acceptance_points(self, acceptance_rate: float) -> float:
+        """Acceptance points for a single acceptance rate value."""
         # Scale acceptance rate to points (0-100% -> 0-10 points)
-        return (underwriter.acceptance_rate / 100) * self.ACCEPTANCE_RATE_MAX_POINTS
+        return (acceptance_rate / 100) * self.ACCEPTANCE_RATE_MAX_POINTS
 
     def _score_workload(self, underwriter: Underwriter) -> float:
         """Score adjustment based on current workload (Low/Medium/High enum)."""
         if not hasattr(underwriter, 'current_workload'):
             return 0.0
+        return self._workload_points(underwriter.current_workload)
 
-        workload = underwriter.current_workload
-
+    def _workload_points(self, workload: Workload) -> float:
+        """Workload adjustment for a single workload level."""
         # Convert workload enum to score adjustment
         # Low workload = bonus, High workload = penalty
-        from underwriter_db import Workload
         if workload == Workload.LOW:
             return self.WORKLOAD_BONUS_MAX  # +10 bonus for available capacity
         elif workload == Workload.HIGH:
@@ -517,6 +671,56 @@ class RoutingEngine:
         else:  # MEDIUM
             return 0.0  # No adjustment for normal workload
 
+    def score_columns(
+        self,
+        columns: UnderwriterColumns,
+        risk_profile: RiskProfile
+    ) -> list[float]:
+        """
+        Score every underwriter in a column view against a risk profile.
+
+        Works one criterion at a time over the column tuples, so each
+        criterion is evaluated once per distinct value rather than once per
+        underwriter object. Totals match score_underwriter() exactly.
+
+        Args:
+            columns: Column-oriented underwriter view
+            risk_profile: The risk profile to match against
+
+        Returns:
+            Total score per underwriter, in column row order
+        """
+        # Regions, workloads and turnarounds repeat across the panel
+        region_points = {
+            region: self._region_points(region, risk_profile.region)
+            for region in set(columns.regions)
+        }
+        workload_points = {
+            workload: self._workload_points(workload)
+            for workload in set(columns.workloads)
+        }
+        turnaround_points = {
+            days: self._turnaround_points(days, risk_profile.urgency)
+            for days in set(columns.avg_turnaround_days)
+        }
+
+        criteria = (
+            [region_points[region] for region in columns.regions],
+            self._naics_column_points(columns.naics_specialties, risk_profile.naics_code),
+            [
+                self._appetite_points(appetite, aversions, aversions_lc, risk_profile)
+                for appetite, aversions, aversions_lc in zip(
+                    columns.risk_appetite, columns.risk_aversions, columns.risk_aversions_lc
+                )
+            ],
+            [turnaround_points[days] for days in columns.avg_turnaround_days],
+            [self._acceptance_points(rate) for rate in columns.acceptance_rates],
+            [workload_points[workload] for workload in columns.workloads],
+        )
+
+        # Same summation order as score_underwriter()
+        return [sum(row, 0.0) for row in zip(*criteria)]
+
     def get_recommendations(
         self,
         mapped_output: MappedFormOutput,
@@ -525,7 +729,7 @@ class RoutingEngine:
         """
         Get top N underwriter recommendations for a submission.
 
-        Extracts the risk profile, scores all underwriters, and returns
+        Extracts the risk profile, scores the engine's underwriters, and returns
         the top matches with justifications.
 
         Args:
@@ -538,22 +742,22 @@ class RoutingEngine:
         # Extract risk profile
         risk_profile = self.extract_risk_profile(mapped_output)
 
-        # Get all underwriters
-        underwriters = get_all_underwriters()
-
-        # Score each underwriter
-        scores: list[UnderwriterScore] = []
-        for underwriter in underwriters:
-            score = self.score_underwriter(underwriter, risk_profile)
-            scores.append(score)
+        # Score the panel column-wise (the database view is built once and shared)
+        columns = self._columns if self._columns is not None else get_underwriter_columns()
+        totals = self.score_columns(columns, risk_profile)
 
-        # Sort by total score (descending)
-        scores.sort(key=lambda x: x.total_score, reverse=True)
+        # Partial top-N selection (same order as a full descending sort);
+        # only the top N need a full breakdown
+        ranked = heapq.nlargest(top_n, range(len(totals)), key=totals.__getitem__)
+        scores: list[UnderwriterScore] = [
+            self.score_underwriter(columns.underwriters[i], risk_profile)
+            for i in ranked
+        ]
 
         # Generate recommendations for top N
         recommendations: list[RoutingRecommendation] = []
 
-        for i, score in enumerate(scores[:top_n]):
+        for i, score in enumerate(scores):
             justification = self._generate_justification(score, risk_profile)
 
             # For the top recommendation, include alternatives
@@ -565,7 +769,7 @@ class RoutingEngine:
                         justification=self._generate_justification(alt_score, risk_profile),
                         alternatives=[]
                     )
-                    for alt_score in scores[1:top_n]
+                    for alt_score in scores[1:]
                 ]
             else:
                 alternatives = []
@@ -718,7 +922,7 @@ def main():
     print(f"      - NAICS Code: {risk_profile.naics_code}")
     print(f"      - Region: {risk_profile.region}")
     print(f"      - Business Type: {risk_profile.business_type}")
-    print(f"      - Hazards: {', '.join(risk_profile.hazards) if risk_profile.hazards else 'None identified'}")
+    print(f"      - Hazards: {', '.join(sorted(risk_profile.hazards)) if risk_profile.hazards else 'None identified'}")
     print(f"      - Liquor Liability: {'Yes' if risk_profile.liquor_liability else 'No'}")
     print(f"      - Urgency: {risk_profile.urgency}")
 
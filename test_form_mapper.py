@@ -4,11 +4,8 @@ Tests schema validation, mapping logic, and broker task generation
 """
 
 import pytest
-import json
-import os
 
 from extract import (
-    Address,
     BusinessEntity,
     IndustryClassification,
     RevenueDetails,
@@ -16,7 +13,6 @@ from extract import (
     InsuranceHistory,
     SocialContext,
     DiscoveryCallExtraction,
-    extract_from_transcript,
 )
 
 from form_mapper import (
@@ -28,6 +24,7 @@ from form_mapper import (
     BrokerTaskList,
     MappedFormOutput,
     FormMapper,
+    OCCUPANCY_MAP,
     map_extraction_to_forms,
 )
 
@@ -36,52 +33,25 @@ from form_mapper import (
 # FIXTURES
 # =============================================================================
 
-@pytest.fixture
-def sample_extraction():
-    """Complete extraction matching transcript.txt"""
-    return DiscoveryCallExtraction(
-        business_entity=BusinessEntity(
-            legal_name=None,
-            dba="The Rusty Anchor",
-            address=Address(
-                street="450 Maple Avenue",
-                city="Charleston",
-                state="South Carolina",
-                zip_code="29401"
-            ),
-            occupancy_type="Leasing"
-        ),
-        industry_classification=IndustryClassification(
-            naics_code="722410",
-            sic_code="5813",
-            business_description="Tavern focusing on high-end cocktails with piano entertainment"
-        ),
-        revenue_details=RevenueDetails(
-            gross_annual_sales=850000.0,
-            alcohol_percentage=70.0,
-            food_percentage=30.0
-        ),
-        risk_factors=RiskFactors(
-            hazards=["piano player", "high-end cocktails"],
-            operating_hours=None,
-            special_features=[]
-        ),
-        insurance_history=InsuranceHistory(
-            past_carrier="Geico",
-            past_carrier_context="personal",
-            current_need="specialized business policy",
-            urgency="ASAP"
-        ),
-        social_context=SocialContext(
-            availability_notes="Unavailable until 1:00 PM Tuesday",
-            preferred_contact_time="Tuesday afternoon",
-            personal_constraints="daughter's dentist appointment",
-            contact_restrictions="Don't call tomorrow morning"
-        )
-    )
+@pytest.fixture(scope="session")
+def base_extraction(build_extraction):
+    """Complete extraction matching transcript.txt, built once per session"""
+    return build_extraction(hazards=["piano player", "high-end cocktails"], special_features=[])
 
 
 @pytest.fixture
+def sample_extraction(base_extraction):
+    """Per-test deep copy of base_extraction so mutations never leak between tests"""
+    return base_extraction.model_copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def sample_mapped_output(base_extraction):
+    """map_extraction_to_forms(base_extraction), computed once for the read-only mapper tests"""
+    return map_extraction_to_forms(base_extraction)
+
+
+@pytest.fixture(scope="session")
 def minimal_extraction():
     """Minimal extraction with many missing fields"""
     return DiscoveryCallExtraction(
@@ -98,13 +68,6 @@ def minimal_extraction():
     )
 
 
-@pytest.fixture
-def sample_transcript():
-    """Load the actual transcript.txt"""
-    with open("transcript.txt", "r") as f:
-        return f.read()
-
-
 # =============================================================================
 # UNIT TESTS: ACCORD 125 SCHEMA
 # =============================================================================
@@ -133,10 +96,9 @@ class TestAccord125Schema:
         form.premises.city = "Charleston"
 
         json_str = form.model_dump_json()
-        parsed = json.loads(json_str)
 
-        assert parsed["applicant"]["dba"] == "Test Business"
-        assert parsed["premises"]["city"] == "Charleston"
+        assert '"dba":"Test Business"' in json_str
+        assert '"city":"Charleston"' in json_str
 
 
 # =============================================================================
@@ -205,9 +167,9 @@ class TestBrokerTasks:
 class TestFormMapperWriteOncePopulateMany:
     """Tests for 'write once, populate many' logic"""
 
-    def test_address_populates_both_sections(self, sample_extraction):
+    def test_address_populates_both_sections(self, sample_mapped_output):
         """Address should populate both mailing and premises sections"""
-        output = map_extraction_to_forms(sample_extraction)
+        output = sample_mapped_output
 
         # Mailing address (Accord 125 Applicant section)
         assert output.accord_125.applicant.mailing_address == "450 Maple Avenue"
@@ -221,9 +183,9 @@ class TestFormMapperWriteOncePopulateMany:
         assert output.accord_125.premises.state == "South Carolina"
         assert output.accord_125.premises.zip_code == "29401"
 
-    def test_naics_populates_multiple_forms(self, sample_extraction):
+    def test_naics_populates_multiple_forms(self, sample_mapped_output):
         """NAICS code should appear in both business info and GL classification"""
-        output = map_extraction_to_forms(sample_extraction)
+        output = sample_mapped_output
 
         assert output.accord_125.business.naics_code == "722410"
         assert output.accord_126.classification.class_code == "722410"
@@ -241,50 +203,62 @@ class TestFormMapperNoHallucination:
         assert output.accord_125.premises.street_address is None
         assert output.accord_125.revenue.annual_gross_sales is None
 
-    def test_missing_legal_name_stays_null(self, sample_extraction):
+    def test_missing_legal_name_stays_null(self, sample_mapped_output):
         """Legal name was not in transcript, must stay null"""
-        output = map_extraction_to_forms(sample_extraction)
+        output = sample_mapped_output
         assert output.accord_125.applicant.applicant_name is None
 
 
 class TestFormMapperOccupancy:
     """Tests for occupancy type mapping"""
 
-    def test_leasing_maps_to_tenant(self, sample_extraction):
-        """'Leasing' should map to TENANT"""
-        output = map_extraction_to_forms(sample_extraction)
-        assert output.accord_125.premises.occupancy == PremisesOccupancy.TENANT
+    @pytest.mark.parametrize("occupancy_type,expected", [
+        ("Leasing", PremisesOccupancy.TENANT),
+        ("Owning", PremisesOccupancy.OWNER),
+        ("Own", PremisesOccupancy.OWNER),
+    ])
+    def test_occupancy_mapping(self, base_extraction, occupancy_type, expected):
+        """Occupancy wording should map to the matching premises enum"""
+        extraction = base_extraction.model_copy(update={
+            "business_entity": base_extraction.business_entity.model_copy(
+                update={"occupancy_type": occupancy_type}
+            )
+        })
+        output = map_extraction_to_forms(extraction)
+        assert output.accord_125.premises.occupancy == expected
 
-    def test_owning_maps_to_owner(self):
-        """'Owning' should map to OWNER"""
-        extraction = DiscoveryCallExtraction(
-            business_entity=BusinessEntity(
-                dba="Test",
-                occupancy_type="Owning"
-            ),
-            industry_classification=IndustryClassification(
-                business_description="Test business"
+    def test_occupancy_substring_fallback(self, base_extraction):
+        """Free-form wording outside OCCUPANCY_MAP should still be classified"""
+        extraction = base_extraction.model_copy(update={
+            "business_entity": base_extraction.business_entity.model_copy(
+                update={"occupancy_type": "We lease the space"}
             )
-        )
+        })
         output = map_extraction_to_forms(extraction)
-        assert output.accord_125.premises.occupancy == PremisesOccupancy.OWNER
+        assert output.accord_125.premises.occupancy == PremisesOccupancy.TENANT
+
+    def test_occupancy_map_is_read_only(self):
+        """The shared lookup table must not be mutable at runtime"""
+        assert OCCUPANCY_MAP["leasing"] == PremisesOccupancy.TENANT
+        with pytest.raises(TypeError):
+            OCCUPANCY_MAP["sublet"] = PremisesOccupancy.TENANT
 
 
 class TestFormMapperLiquorLiability:
     """Tests for liquor liability mapping"""
 
-    def test_high_alcohol_triggers_liquor_liability(self, sample_extraction):
+    def test_high_alcohol_triggers_liquor_liability(self, sample_mapped_output):
         """70% alcohol sales should trigger liquor liability"""
-        output = map_extraction_to_forms(sample_extraction)
+        output = sample_mapped_output
 
         assert output.accord_126.liquor_liability.liquor_liability_required is True
         assert output.accord_126.liquor_liability.liquor_liability_type == LiquorLiabilityType.SELL
         assert output.accord_126.liquor_liability.alcohol_sales_percentage == 70.0
         assert output.accord_126.liquor_liability.food_sales_percentage == 30.0
 
-    def test_liquor_receipts_calculated(self, sample_extraction):
+    def test_liquor_receipts_calculated(self, sample_mapped_output):
         """Annual liquor receipts should be calculated from gross sales"""
-        output = map_extraction_to_forms(sample_extraction)
+        output = sample_mapped_output
 
         # $850,000 * 70% = $595,000
         expected = 850000.0 * 0.70
@@ -299,16 +273,26 @@ class TestFormMapperLiquorLiability:
 class TestFormMapperEntertainment:
     """Tests for entertainment/hazard mapping"""
 
-    def test_piano_triggers_live_entertainment(self, sample_extraction):
+    def test_piano_triggers_live_entertainment(self, sample_mapped_output):
         """Piano player should trigger live entertainment flag"""
-        output = map_extraction_to_forms(sample_extraction)
+        output = sample_mapped_output
 
         assert output.accord_126.entertainment.live_entertainment is True
         assert "piano" in output.accord_126.entertainment.entertainment_description.lower()
 
-    def test_hazards_copied_to_form(self, sample_extraction):
+    def test_late_night_hours_flagged(self, base_extraction):
+        """Closing after midnight should set the late-night operations flag"""
+        extraction = base_extraction.model_copy(update={
+            "risk_factors": base_extraction.risk_factors.model_copy(
+                update={"operating_hours": "5 PM - 2 AM"}
+            )
+        })
+        output = map_extraction_to_forms(extraction)
+        assert output.accord_126.hours.late_night_operations is True
+
+    def test_hazards_copied_to_form(self, sample_mapped_output):
         """Hazards list should be copied to Accord 126"""
-        output = map_extraction_to_forms(sample_extraction)
+        output = sample_mapped_output
 
         assert "piano player" in output.accord_126.hazards.hazards
         assert "high-end cocktails" in output.accord_126.hazards.hazards
@@ -317,9 +301,9 @@ class TestFormMapperEntertainment:
 class TestFormMapperHarperTouch:
     """Tests for Harper Touch (social context) mapping"""
 
-    def test_contact_preferences_mapped(self, sample_extraction):
+    def test_contact_preferences_mapped(self, sample_mapped_output):
         """Social context should map to contact preferences"""
-        output = map_extraction_to_forms(sample_extraction)
+        output = sample_mapped_output
 
         assert output.accord_125.contact.preferred_contact_time == "Tuesday afternoon"
         assert output.accord_125.contact.contact_restrictions == "Don't call tomorrow morning"
@@ -338,9 +322,9 @@ class TestFormMapperBrokerTaskGeneration:
         field_names = [t.field_name for t in output.broker_tasks.tasks]
         assert "premises.street_address" in field_names
 
-    def test_complete_extraction_fewer_tasks(self, sample_extraction):
+    def test_complete_extraction_fewer_tasks(self, sample_mapped_output):
         """Complete extraction should have fewer broker tasks"""
-        output = map_extraction_to_forms(sample_extraction)
+        output = sample_mapped_output
 
         # Only legal_name should be missing (it was null in extraction)
         task_fields = [t.field_name for t in output.broker_tasks.tasks]
@@ -363,17 +347,17 @@ class TestFormMapperBrokerTaskGeneration:
 class TestFormMapperSummary:
     """Tests for mapping summary generation"""
 
-    def test_summary_includes_completion_percentage(self, sample_extraction):
+    def test_summary_includes_completion_percentage(self, sample_mapped_output):
         """Summary should include completion percentages"""
-        output = map_extraction_to_forms(sample_extraction)
+        output = sample_mapped_output
 
         assert "accord_125" in output.mapping_summary
         assert "completion_percentage" in output.mapping_summary["accord_125"]
         assert output.mapping_summary["accord_125"]["completion_percentage"] > 0
 
-    def test_summary_includes_broker_task_count(self, sample_extraction):
+    def test_summary_includes_broker_task_count(self, sample_mapped_output):
         """Summary should include broker task count"""
-        output = map_extraction_to_forms(sample_extraction)
+        output = sample_mapped_output
         assert "broker_tasks_count" in output.mapping_summary
 
 
@@ -381,68 +365,70 @@ class TestFormMapperSummary:
 # INTEGRATION TESTS: REAL API
 # =============================================================================
 
-@pytest.mark.integration
-@pytest.mark.skipif(
-    not os.getenv("OPENAI_API_KEY"),
-    reason="OPENAI_API_KEY not set - skipping integration tests"
-)
-class TestIntegrationEndToEnd:
-    """End-to-end integration tests: transcript → extraction → mapping"""
+def _check_full_pipeline(output):
+    """Transcript facts should land in the right Accord 125/126 fields"""
+    # Verify Accord 125
+    assert output.accord_125.applicant.dba == "The Rusty Anchor"
+    assert output.accord_125.premises.street_address == "450 Maple Avenue"
+    assert output.accord_125.premises.occupancy == PremisesOccupancy.TENANT
+    assert output.accord_125.revenue.annual_gross_sales == 850000.0
+
+    # Verify Accord 126
+    assert output.accord_126.liquor_liability.liquor_liability_required is True
+    assert output.accord_126.liquor_liability.alcohol_sales_percentage == 70.0
+    assert output.accord_126.entertainment.live_entertainment is True
+
+    # Verify Harper Touch preserved (at least one social context field mapped)
+    harper_touch_present = (
+        output.accord_125.contact.preferred_contact_time is not None or
+        output.accord_125.contact.contact_restrictions is not None
+    )
+    assert harper_touch_present, "Harper Touch fields should be populated"
 
-    def test_full_pipeline(self, sample_transcript):
-        """Test complete pipeline from transcript to mapped forms"""
-        # Phase 1: Extract
-        extraction = extract_from_transcript(sample_transcript)
 
-        # Phase 2: Map
-        output = map_extraction_to_forms(extraction)
+def _check_context_differentiation(output):
+    """Prior insurance context should be preserved through mapping"""
+    # Past carrier was for personal insurance
+    assert output.accord_125.prior_insurance.prior_carrier == "Geico"
+    assert "personal" in output.accord_125.prior_insurance.prior_coverage_type.lower()
 
-        # Verify Accord 125
-        assert output.accord_125.applicant.dba == "The Rusty Anchor"
-        assert output.accord_125.premises.street_address == "450 Maple Avenue"
-        assert output.accord_125.premises.occupancy == PremisesOccupancy.TENANT
-        assert output.accord_125.revenue.annual_gross_sales == 850000.0
 
-        # Verify Accord 126
-        assert output.accord_126.liquor_liability.liquor_liability_required is True
-        assert output.accord_126.liquor_liability.alcohol_sales_percentage == 70.0
-        assert output.accord_126.entertainment.live_entertainment is True
+def _check_no_hallucination(output):
+    """Fields not in transcript should remain null through entire pipeline"""
+    # Legal name was never mentioned
+    assert output.accord_125.applicant.applicant_name is None
 
-        # Verify Harper Touch preserved (at least one social context field mapped)
-        harper_touch_present = (
-            output.accord_125.contact.preferred_contact_time is not None or
-            output.accord_125.contact.contact_restrictions is not None
-        )
-        assert harper_touch_present, "Harper Touch fields should be populated"
+    # FEIN was never mentioned
+    assert output.accord_125.applicant.fein is None
 
-    def test_context_differentiation_preserved(self, sample_transcript):
-        """Prior insurance context should be preserved through mapping"""
-        extraction = extract_from_transcript(sample_transcript)
-        output = map_extraction_to_forms(extraction)
+    # Square footage was never mentioned
+    assert output.accord_125.premises.square_footage is None
 
-        # Past carrier was for personal insurance
-        assert output.accord_125.prior_insurance.prior_carrier == "Geico"
-        assert "personal" in output.accord_125.prior_insurance.prior_coverage_type.lower()
 
-    def test_no_hallucination_through_pipeline(self, sample_transcript):
-        """Fields not in transcript should remain null through entire pipeline"""
-        extraction = extract_from_transcript(sample_transcript)
-        output = map_extraction_to_forms(extraction)
+def _check_broker_tasks_for_missing(output):
+    """Broker tasks should be generated for missing required fields"""
+    # Should have task for missing legal name
+    task_fields = [t.field_name for t in output.broker_tasks.tasks]
+    assert "applicant.applicant_name" in task_fields
 
-        # Legal name was never mentioned
-        assert output.accord_125.applicant.applicant_name is None
 
-        # FEIN was never mentioned
-        assert output.accord_125.applicant.fein is None
+@pytest.fixture(scope="session")
+def pipeline_output(cached_extraction):
+    """Real extraction mapped to forms once, shared by every end-to-end check"""
+    return map_extraction_to_forms(cached_extraction)
 
-        # Square footage was never mentioned
-        assert output.accord_125.premises.square_footage is None
 
-    def test_broker_tasks_generated_for_missing(self, sample_transcript):
-        """Broker tasks should be generated for missing required fields"""
-        extraction = extract_from_transcript(sample_transcript)
-        output = map_extraction_to_forms(extraction)
+@pytest.mark.integration
+@pytest.mark.serial
+class TestIntegrationEndToEnd:
+    """End-to-end integration tests: transcript → extraction → mapping"""
 
-        # Should have task for missing legal name
-        task_fields = [t.field_name for t in output.broker_tasks.tasks]
-        assert "applicant.applicant_name" in task_fields
+    @pytest.mark.parametrize("check", [
+        pytest.param(_check_full_pipeline, id="full_pipeline"),
+        pytest.param(_check_context_differentiation, id="context_differentiation_preserved"),
+        pytest.param(_check_no_hallucination, id="no_hallucination_through_pipeline"),
+        pytest.param(_check_broker_tasks_for_missing, id="broker_tasks_generated_for_missing"),
+    ])
+    def test_pipeline(self, pipeline_output, check):
+        """Each check is a projection of the same (extraction, mapped output) pair"""
+        check(pipeline_output)
@@ -5,9 +5,11 @@ Tests underwriter database, risk profile extraction, and routing engine scoring
 The Computational Broker Engine - Phase 3 Tests
 """
 
+import re
+
 import pytest
-from unittest.mock import patch, MagicMock
-from typing import List
+
+from pydantic import ValidationError
 
 # Phase 1 imports
 from extract import (
@@ -19,7 +21,6 @@ from extract import (
     RiskFactors,
     InsuranceHistory,
     SocialContext,
-    extract_from_transcript,
 )
 
 # Phase 2 imports
@@ -27,13 +28,6 @@ from form_mapper import (
     MappedFormOutput,
     Accord125_Form,
     Accord126_Form,
-    Accord125_ApplicantInfo,
-    Accord125_PremisesInfo,
-    Accord125_BusinessInfo,
-    Accord125_RevenueInfo,
-    Accord126_LiquorLiability,
-    Accord126_EntertainmentExposure,
-    Accord126_OperationsHazards,
     BrokerTaskList,
     PremisesOccupancy,
     LiquorLiabilityType,
@@ -41,30 +35,49 @@ from form_mapper import (
 )
 
 # Phase 3 imports (modules to be implemented)
+import underwriter_db
 from underwriter_db import (
+    Region,
     Underwriter,
     get_all_underwriters,
     get_underwriters_by_region,
     get_underwriters_by_naics,
+    get_underwriters_by_naics_prefix,
+    get_underwriters_by_risk_appetite,
+    get_available_underwriters,
+    Workload,
+    build_underwriter_soa,
+    UNDERWRITER_COLUMNS,
 )
 
 from routing_engine import (
     RoutingEngine,
     RiskProfile,
-    UnderwriterRecommendation,
-    RoutingResult,
+    classify_naics,
 )
 
 
+# Case-insensitive keyword patterns for the justification assertions
+_JUST_REGION_RE = re.compile(r"southeast|region|south carolina|sc", re.IGNORECASE)
+_JUST_TURNAROUND_RE = re.compile(r"turnaround|day|quick|fast", re.IGNORECASE)
+_JUST_ACCEPTANCE_RE = re.compile(r"acceptance|rate|percent|%", re.IGNORECASE)
+_JUST_SPECIALTY_RE = re.compile(r"bar|tavern|hospitality|722410|specialty", re.IGNORECASE)
+
+
 # =============================================================================
 # FIXTURES
 # =============================================================================
 
-@pytest.fixture
+# Fixtures are module-scoped and treated as read-only; a test that needs to
+# edit one takes model_copy(deep=True) first.
+
+@pytest.fixture(scope="module")
 def sample_mapped_output():
     """
     A MappedFormOutput for "The Rusty Anchor" bar in Charleston, SC.
     This represents a typical bar/tavern with live entertainment.
+
+    Built once per module and shared; tests that edit it take a deep copy first.
     """
     # Create Accord 125 form
     accord_125 = Accord125_Form()
@@ -118,7 +131,7 @@ def sample_mapped_output():
     return mapped_output
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_underwriter():
     """
     An underwriter who specializes in bars in the Southeast region.
@@ -140,7 +153,7 @@ def sample_underwriter():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_construction_underwriter():
     """
     An underwriter who specializes in construction - poor match for bars.
@@ -162,7 +175,7 @@ def sample_construction_underwriter():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_fast_underwriter():
     """
     A fast underwriter with quick turnaround but lower acceptance rate.
@@ -183,7 +196,7 @@ def sample_fast_underwriter():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_high_acceptance_underwriter():
     """
     An underwriter with high acceptance rate but slower turnaround.
@@ -204,7 +217,7 @@ def sample_high_acceptance_underwriter():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_extraction():
     """Sample DiscoveryCallExtraction for The Rusty Anchor"""
     return DiscoveryCallExtraction(
@@ -249,28 +262,16 @@ def sample_extraction():
     )
 
 
-@pytest.fixture
-def sample_transcript():
-    """Load the actual transcript for integration tests"""
-    try:
-        with open("transcript.txt", "r") as f:
-            return f.read()
-    except FileNotFoundError:
-        # Return a minimal transcript if file doesn't exist
-        return """
-        Broker: What's the business name?
-        Client: It's called "The Rusty Anchor" at 450 Maple Avenue, Charleston, South Carolina 29401.
-        Broker: What type of business is it?
-        Client: It's a bar - we focus on high-end cocktails. We also have a piano player on weekends.
-        Broker: Are you leasing or do you own the space?
-        Client: Leasing.
-        Broker: What are your projected annual revenues?
-        Client: About $850,000. Around 70% from alcohol, 30% from food.
-        Broker: Any current insurance?
-        Client: Just Geico for my personal car. We need a specialized business policy ASAP.
-        Broker: When can I call you?
-        Client: Not tomorrow morning - my daughter has a dentist appointment. Tuesday afternoon works.
-        """
+@pytest.fixture(scope="module")
+def engine():
+    """One RoutingEngine shared by every test in the module (it holds no per-test state)"""
+    return RoutingEngine()
+
+
+@pytest.fixture(scope="module")
+def profile(engine, sample_mapped_output):
+    """Risk profile extracted from sample_mapped_output"""
+    return engine.extract_risk_profile(sample_mapped_output)
 
 
 # =============================================================================
@@ -285,13 +286,20 @@ class TestUnderwriterDatabase:
         underwriters = get_all_underwriters()
         assert len(underwriters) == 10, f"Expected 10 underwriters, got {len(underwriters)}"
 
-    def test_get_all_underwriters_returns_list(self):
-        """Verify get_all_underwriters returns a list of Underwriter objects"""
+    def test_get_all_underwriters_returns_tuple(self):
+        """Verify get_all_underwriters returns a shared tuple of Underwriter objects"""
         underwriters = get_all_underwriters()
-        assert isinstance(underwriters, list)
+        assert isinstance(underwriters, tuple)
+        assert get_all_underwriters() is underwriters
         for uw in underwriters:
             assert isinstance(uw, Underwriter)
 
+    def test_get_all_underwriters_copy_returns_list(self):
+        """copy=True should hand back a fresh mutable list"""
+        underwriters = get_all_underwriters(copy=True)
+        assert isinstance(underwriters, list)
+        assert underwriters == list(get_all_underwriters())
+
     def test_get_underwriters_by_region(self):
         """Verify filtering by region works correctly"""
         # Test Southeast region
@@ -311,6 +319,25 @@ class TestUnderwriterDatabase:
 
         assert len(uws_lower) == len(uws_upper) == len(uws_mixed)
 
+    def test_specialty_tags_derived_from_row(self):
+        """Specialty tags come from NAICS codes, appetite and notes"""
+        tags = {uw.name: uw.specialty_tags for uw in get_all_underwriters()}
+        assert {"bar", "hospitality"} <= tags["Sarah Mitchell"]
+        assert tags["Michael Chen"] == {"tech"}
+        assert "bar" not in tags["Jennifer Rodriguez"]
+        assert "specialty_tags" not in get_all_underwriters()[0].model_dump()
+
+    def test_get_underwriters_by_region_rejects_unknown_region(self):
+        """Unknown region names should raise and list the valid regions"""
+        with pytest.raises(ValueError, match="Valid regions"):
+            get_underwriters_by_region("Atlantis")
+
+    @pytest.mark.parametrize("region", [None, 42, ["Southeast"]])
+    def test_get_underwriters_by_region_rejects_non_string(self, region):
+        """Non-string regions raise the same ValueError as unknown names"""
+        with pytest.raises(ValueError, match="Valid regions"):
+            get_underwriters_by_region(region)
+
     def test_get_underwriters_by_naics(self):
         """Verify filtering by NAICS code works correctly"""
         # NAICS 722410 = Drinking Places (Alcoholic Beverages) - bars/taverns
@@ -324,6 +351,109 @@ class TestUnderwriterDatabase:
         unknown_naics_uws = get_underwriters_by_naics("999999")
         assert len(unknown_naics_uws) == 0
 
+    def test_get_underwriters_by_naics_prefix_widens_to_broader_codes(self):
+        """Codes without an exact specialist fall back to the industry group, then the sector"""
+        assert get_underwriters_by_naics_prefix("722410") == get_underwriters_by_naics("722410")
+
+        # No 722499 specialist; 7224 (drinking places) matches the bar specialists
+        assert get_underwriters_by_naics_prefix("722499") == get_underwriters_by_naics("722410")
+
+        # No 7219 group either; the 72 sector adds the hotel specialist
+        sector = get_underwriters_by_naics_prefix("721999")
+        assert set(get_underwriters_by_naics("722410")) < set(sector)
+
+        assert get_underwriters_by_naics_prefix("999999") == ()
+        with pytest.raises(ValueError):
+            get_underwriters_by_naics_prefix("722410", levels=(5,))
+
+    @pytest.mark.parametrize("naics_code", [None, 722410])
+    def test_get_underwriters_by_naics_prefix_rejects_non_string(self, naics_code):
+        """Non-string codes raise ValueError instead of a slicing TypeError"""
+        with pytest.raises(ValueError, match="Invalid NAICS code"):
+            get_underwriters_by_naics_prefix(naics_code)
+
+    @pytest.mark.parametrize("risk_type", ["Bars", "bars", "BAR"])
+    def test_get_underwriters_by_risk_appetite_case_insensitive(self, risk_type):
+        """Appetite lookup should match exact and partial types in any case"""
+        names = [uw.name for uw in get_underwriters_by_risk_appetite(risk_type)]
+        assert "Sarah Mitchell" in names
+        assert "Michael Chen" not in names
+
+    @pytest.mark.parametrize("max_workload,allowed", [
+        (Workload.LOW, {Workload.LOW}),
+        (Workload.MEDIUM, {Workload.LOW, Workload.MEDIUM}),
+        (Workload.HIGH, set(Workload)),
+    ])
+    def test_get_available_underwriters_by_workload_rank(self, max_workload, allowed):
+        """Only underwriters at or below the requested workload are returned"""
+        available = get_available_underwriters(max_workload)
+        expected = tuple(uw for uw in get_all_underwriters() if uw.current_workload in allowed)
+        assert available == expected
+
+    def test_selectivity_stats_rank_most_selective_first(self):
+        """Tracked queries report calls and result sizes, most selective first"""
+        underwriter_db.reset_selectivity_stats()
+        underwriter_db.set_selectivity_tracking(True)
+        try:
+            get_underwriters_by_naics("722410")
+            get_available_underwriters(Workload.HIGH)
+        finally:
+            underwriter_db.set_selectivity_tracking(False)
+
+        stats = underwriter_db.get_selectivity_stats()
+        assert list(stats) == ["get_underwriters_by_naics", "get_available_underwriters"]
+        assert stats["get_available_underwriters"] == {"calls": 1, "rows": 10, "selectivity": 1.0}
+
+        # Nothing is recorded once tracking is off
+        get_underwriters_by_naics("722410")
+        assert underwriter_db.get_selectivity_stats() == stats
+        underwriter_db.reset_selectivity_stats()
+
+    def test_queries_return_shared_tuples(self):
+        """Repeated queries hand back the same immutable result"""
+        assert get_underwriters_by_naics("722410") is get_underwriters_by_naics("722410")
+        assert get_underwriters_by_region("southeast") is get_underwriters_by_region(Region.SOUTHEAST)
+        assert get_underwriters_by_risk_appetite("Bars") is get_underwriters_by_risk_appetite("Bars")
+        assert get_available_underwriters(Workload.LOW) is get_available_underwriters(Workload.LOW)
+        assert isinstance(get_underwriters_by_naics("999999"), tuple)
+
+    @pytest.mark.parametrize("field,value", [
+        ("avg_turnaround_days", 0.1),
+        ("avg_turnaround_days", 45.0),
+        ("acceptance_rate", 1.5),
+        ("acceptance_rate", -0.1),
+    ])
+    def test_underwriter_ranges_validated(self, field, value):
+        """Out-of-range turnaround and acceptance values are rejected on construction"""
+        row = get_all_underwriters()[0].model_dump()
+        with pytest.raises(ValidationError):
+            Underwriter.model_validate({**row, field: value})
+
+    def test_collections_pooled_only_within_a_load(self):
+        """Equal collections are shared across database rows but not with rows built later"""
+        by_name = {uw.name: uw for uw in get_all_underwriters()}
+        sarah, robert = by_name["Sarah Mitchell"], by_name["Robert Garcia"]
+        assert sarah.specialty_tags is robert.specialty_tags
+
+        rebuilt = Underwriter.model_validate(sarah.model_dump())
+        assert rebuilt.specialty_tags == sarah.specialty_tags
+        assert rebuilt.specialty_tags is not sarah.specialty_tags
+
+    def test_underwriters_are_frozen(self):
+        """Database rows are read-only and hashable"""
+        uw = get_all_underwriters()[0]
+        with pytest.raises(ValidationError):
+            uw.name = "Someone Else"
+        assert isinstance(uw.naics_specialties, tuple)
+        assert len({hash(u) for u in get_all_underwriters()}) == 10
+
+    def test_indexes_are_read_only(self):
+        """The shared indexes cannot be modified in place"""
+        with pytest.raises(TypeError):
+            underwriter_db._naics_index()["722410"] = ()
+        with pytest.raises(TypeError):
+            underwriter_db._region_index()["southeast"] = ()
+
     def test_underwriter_schema_validation(self):
         """Verify all underwriters have required fields"""
         underwriters = get_all_underwriters()
@@ -365,94 +495,168 @@ class TestUnderwriterDatabase:
 class TestRiskProfileExtraction:
     """Tests for extracting risk profile from mapped form output"""
 
-    def test_extract_risk_profile(self, sample_mapped_output):
+    def test_extract_risk_profile(self, profile):
         """Verify NAICS, region, hazards extracted correctly from mapped output"""
-        engine = RoutingEngine()
-        profile = engine.extract_risk_profile(sample_mapped_output)
-
         assert isinstance(profile, RiskProfile)
         assert profile.naics_code == "722410"
         assert profile.state == "South Carolina"
         assert "Charleston" in profile.city
         assert "live entertainment" in profile.hazards or "piano" in str(profile.hazards).lower()
 
-    def test_extract_risk_profile_includes_alcohol(self, sample_mapped_output):
+    def test_extract_risk_profile_includes_alcohol(self, profile):
         """Verify alcohol percentage is captured in risk profile"""
-        engine = RoutingEngine()
-        profile = engine.extract_risk_profile(sample_mapped_output)
-
         assert profile.alcohol_percentage == 70.0
         assert profile.liquor_liability_required is True
 
-    def test_extract_risk_profile_includes_revenue(self, sample_mapped_output):
+    def test_extract_risk_profile_includes_revenue(self, profile):
         """Verify annual revenue is captured in risk profile"""
-        engine = RoutingEngine()
-        profile = engine.extract_risk_profile(sample_mapped_output)
-
         assert profile.annual_revenue == 850000.0
 
-    def test_extract_risk_profile_identifies_region(self, sample_mapped_output):
+    def test_extract_risk_profile_identifies_region(self, profile):
         """Verify region is correctly identified from state"""
-        engine = RoutingEngine()
-        profile = engine.extract_risk_profile(sample_mapped_output)
-
         # South Carolina should be identified as Southeast region
         assert profile.region == "Southeast"
 
 
+class TestNAICSClassification:
+    """Tests for the memoized NAICS business type resolver"""
+
+    def test_exact_and_prefix_codes(self):
+        """Exact codes resolve directly; unknown 6-digit codes fall back to the 4-digit prefix"""
+        assert classify_naics("722410") == "bar"
+        assert classify_naics("722499") == "bar"
+        assert classify_naics("999999") is None
+
+    def test_resolver_is_cached(self):
+        """Repeated lookups of the same code should be served from the cache"""
+        classify_naics.cache_clear()
+        classify_naics("722410")
+        classify_naics("722410")
+        assert classify_naics.cache_info().hits >= 1
+
+
 class TestRegionMatchScoring:
     """Tests for region match scoring logic"""
 
-    def test_region_match_scoring(self, sample_mapped_output, sample_underwriter):
+    def test_region_match_scoring(self, engine, profile, sample_underwriter):
         """Southeast underwriter should score higher for SC address"""
-        engine = RoutingEngine()
-        profile = engine.extract_risk_profile(sample_mapped_output)
-
         score = engine._score_region_match(profile, sample_underwriter)
 
         # Southeast underwriter should get high score for SC business
         assert score > 0, "Region match should produce positive score"
         assert score >= 0.8, "Southeast underwriter should score at least 0.8 for SC"
 
-    def test_region_mismatch_scoring(self, sample_mapped_output, sample_construction_underwriter):
+    def test_region_mismatch_scoring(self, engine, profile, sample_construction_underwriter):
         """Northeast underwriter should score lower for SC address"""
-        engine = RoutingEngine()
-        profile = engine.extract_risk_profile(sample_mapped_output)
-
         score = engine._score_region_match(profile, sample_construction_underwriter)
 
         # Northeast underwriter should get low score for SC business
         assert score < 0.5, "Region mismatch should produce low score"
 
-    def test_nationwide_underwriter_gets_moderate_score(self, sample_mapped_output, sample_fast_underwriter):
+    def test_nationwide_underwriter_gets_moderate_score(self, engine, profile, sample_fast_underwriter):
         """Nationwide underwriter should get moderate score for any region"""
-        engine = RoutingEngine()
-        profile = engine.extract_risk_profile(sample_mapped_output)
-
         score = engine._score_region_match(profile, sample_fast_underwriter)
 
         # Nationwide should get moderate score
         assert 0.4 <= score <= 0.7, "Nationwide underwriter should get moderate score"
 
+    @pytest.mark.parametrize("uw_region,profile_region,expected", [
+        (Region.SOUTHEAST, "Southeast", RoutingEngine.REGION_MATCH_POINTS),
+        (Region.SOUTHWEST, "Southeast", RoutingEngine.REGION_MATCH_POINTS * 0.5),
+        (Region.WEST, "Southeast", 0.0),
+        (Region.SOUTHEAST, None, 0.0),
+    ])
+    def test_region_points_bitmask(self, engine, uw_region, profile_region, expected):
+        """Exact region earns full points, adjacent regions half, others none"""
+        assert engine._region_points(uw_region, profile_region) == expected
+
+    @pytest.mark.parametrize("region,expected", [
+        ("Southeast", ["Kevin O'Brien", "Sarah Mitchell", "Robert Garcia"]),
+        ("Southwest", ["Kevin O'Brien", "Robert Garcia", "Sarah Mitchell"]),
+        ("West", ["Kevin O'Brien", "Robert Garcia", "Sarah Mitchell"]),
+    ])
+    def test_region_changes_bar_ranking(self, engine, region, expected):
+        """Among bar specialists, the one in or next to the submission's region ranks higher"""
+        columns = build_underwriter_soa()
+        profile = RiskProfile(region=region, naics_code="722410", business_type="bar")
+        totals = engine.score_columns(columns, profile)
+        ranked = sorted(range(len(totals)), key=totals.__getitem__, reverse=True)[:3]
+        assert [columns.underwriters[i].name for i in ranked] == expected
+
+    def test_region_only_profile_prefers_local_underwriters(self, engine):
+        """With nothing but a region, underwriters in that region rank first"""
+        columns = build_underwriter_soa()
+        totals = engine.score_columns(columns, RiskProfile(region="Northeast"))
+        ranked = sorted(range(len(totals)), key=totals.__getitem__, reverse=True)[:2]
+        assert [columns.underwriters[i].region for i in ranked] == [Region.NORTHEAST, Region.NORTHEAST]
+
 
 class TestNAICSSpecialtyScoring:
     """Tests for NAICS specialty scoring logic"""
 
-    def test_naics_specialty_scoring(self, sample_mapped_output, sample_underwriter):
+    @pytest.mark.parametrize("naics_code,credit", [
+        ("722410", 1.0),
+        ("722499", 0.7),
+        ("722999", 0.0),
+        ("721110", 0.0),
+        ("541511", 0.0),
+        (None, 0.0),
+    ])
+    def test_naics_credit_exact_or_industry_group(self, engine, naics_code, credit):
+        """Only an exact code or a shared 4-digit industry group earns credit"""
+        points = engine._naics_points(["722410", "722511"], naics_code)
+        assert points == pytest.approx(RoutingEngine.NAICS_SPECIALTY_POINTS * credit)
+
+    @pytest.mark.parametrize("naics_code,expected", [
+        ("722410", "Kevin O'Brien"),
+        ("541511", "Michael Chen"),
+        ("721110", "Jennifer Rodriguez"),
+        ("312199", "Kevin O'Brien"),
+    ])
+    def test_naics_top_match(self, engine, naics_code, expected):
+        """The best NAICS specialist ranks first when nothing else differs"""
+        columns = build_underwriter_soa()
+        totals = engine.score_columns(columns, RiskProfile(naics_code=naics_code))
+        top = max(range(len(totals)), key=totals.__getitem__)
+        assert columns.underwriters[top].name == expected
+
+    def test_sector_only_match_earns_nothing(self, engine):
+        """Sharing only a NAICS sector (31 manufacturing) gives no specialty credit"""
+        kevin = next(uw for uw in get_all_underwriters() if uw.name == "Kevin O'Brien")
+        score = engine.score_underwriter(kevin, RiskProfile(naics_code="311111"))
+        assert score.breakdown["naics_specialty"] == 0.0
+
+    def test_model_copy_update_changes_score(self, engine):
+        """A copy with updated fields scores on the new data, not the original's lookup keys"""
+        kevin = next(uw for uw in get_all_underwriters() if uw.name == "Kevin O'Brien")
+        profile = RiskProfile(
+            naics_code="722410", region="Southeast", business_type="bar",
+            hazards=frozenset({"live entertainment"}),
+        )
+        copy = kevin.model_copy(update={
+            "naics_specialties": ("541511",),
+            "region": Region.WEST,
+            "risk_aversions": ("Live Entertainment",),
+            "current_workload": Workload.HIGH,
+        })
+
+        breakdown = engine.score_underwriter(copy, profile).breakdown
+        assert breakdown["naics_specialty"] == 0.0
+        assert breakdown["region_match"] == 0.0
+        assert breakdown["workload_adjustment"] == RoutingEngine.WORKLOAD_PENALTY_MAX
+        assert "tech" in copy.specialty_tags and "manufacturing" not in copy.specialty_tags
+        assert engine.score_columns(build_underwriter_soa([copy]), profile) == \
+            [engine.score_underwriter(copy, profile).total_score]
+
+    def test_naics_specialty_scoring(self, engine, profile, sample_underwriter):
         """Bar specialist should score higher for NAICS 722410"""
-        engine = RoutingEngine()
-        profile = engine.extract_risk_profile(sample_mapped_output)
-
         score = engine._score_naics_specialty(profile, sample_underwriter)
 
         # Bar specialist should get high score for bar
         assert score >= 0.9, "Bar specialist should score >= 0.9 for NAICS 722410"
 
-    def test_naics_mismatch_scoring(self, sample_mapped_output, sample_construction_underwriter):
+    def test_naics_mismatch_scoring(self, engine, profile, sample_construction_underwriter):
         """Construction specialist should score lower for bar NAICS"""
-        engine = RoutingEngine()
-        profile = engine.extract_risk_profile(sample_mapped_output)
-
         score = engine._score_naics_specialty(profile, sample_construction_underwriter)
 
         # Construction specialist should get low score for bar
@@ -462,11 +666,8 @@ class TestNAICSSpecialtyScoring:
 class TestRiskAversionScoring:
     """Tests for risk aversion penalty scoring"""
 
-    def test_risk_aversion_penalty(self, sample_mapped_output, sample_construction_underwriter):
+    def test_risk_aversion_penalty(self, engine, sample_mapped_output, sample_construction_underwriter):
         """Construction specialist should score lower for bar (wrong specialty)"""
-        engine = RoutingEngine()
-        profile = engine.extract_risk_profile(sample_mapped_output)
-
         # Overall score should be penalized due to specialty mismatch
         recommendations = engine.get_recommendations(sample_mapped_output, [sample_construction_underwriter])
 
@@ -475,33 +676,46 @@ class TestRiskAversionScoring:
             # Construction underwriter should have low overall score for bar
             assert rec.total_score < 50, "Construction specialist should have low score for bar"
 
-    def test_high_risk_appetite_handles_hazards(self, sample_mapped_output, sample_underwriter):
+    def test_high_risk_appetite_handles_hazards(self, engine, profile, sample_underwriter):
         """Moderate risk appetite underwriter should handle entertainment hazards well"""
-        engine = RoutingEngine()
-        profile = engine.extract_risk_profile(sample_mapped_output)
-
         # Bar specialist with moderate risk appetite should handle bar well
         score = engine._score_risk_appetite(profile, sample_underwriter)
 
         assert score >= 0.6, "Moderate risk appetite should handle bar hazards adequately"
 
+    def test_profile_hazards_are_lowercased(self, engine):
+        """Hazards given in any case still trigger the aversion penalty"""
+        row = get_all_underwriters()[1].model_dump()
+        averse = Underwriter.model_validate({**row, "risk_aversions": ["live entertainment"]})
+        profile = RiskProfile(business_type="bar", hazards={"Live Entertainment"})
+
+        assert profile.hazards == {"live entertainment"}
+        assert engine._score_risk_appetite(averse, profile) == RoutingEngine.RISK_AVERSION_PENALTY
+
+    def test_hazard_aversion_ignores_case(self, engine):
+        """A hazard listed in any case among the aversions triggers the penalty"""
+        row = get_all_underwriters()[1].model_dump()
+        averse = Underwriter.model_validate({**row, "risk_aversions": ["Live Entertainment"]})
+        profile = RiskProfile(business_type="bar", hazards=frozenset({"live entertainment"}))
+
+        assert engine._score_risk_appetite(averse, profile) == RoutingEngine.RISK_AVERSION_PENALTY
+        assert build_underwriter_soa([averse]).risk_aversions_lc == (frozenset({"live entertainment"}),)
+        assert engine.score_columns(build_underwriter_soa([averse]), profile) == \
+            [engine.score_underwriter(averse, profile).total_score]
+
 
 class TestTurnaroundScoring:
     """Tests for turnaround time scoring"""
 
-    def test_turnaround_scoring(self, sample_fast_underwriter, sample_high_acceptance_underwriter):
+    def test_turnaround_scoring(self, engine, sample_fast_underwriter, sample_high_acceptance_underwriter):
         """Faster underwriter should score higher on turnaround"""
-        engine = RoutingEngine()
-
         fast_score = engine._score_turnaround(sample_fast_underwriter)
         slow_score = engine._score_turnaround(sample_high_acceptance_underwriter)
 
         assert fast_score > slow_score, "Faster underwriter should score higher on turnaround"
 
-    def test_turnaround_scoring_values(self, sample_fast_underwriter, sample_underwriter):
+    def test_turnaround_scoring_values(self, engine, sample_fast_underwriter, sample_underwriter):
         """Verify turnaround scoring produces expected values"""
-        engine = RoutingEngine()
-
         # 1-day turnaround should score very high
         fast_score = engine._score_turnaround(sample_fast_underwriter)
         assert fast_score >= 0.9, "1-day turnaround should score >= 0.9"
@@ -514,19 +728,15 @@ class TestTurnaroundScoring:
 class TestAcceptanceRateScoring:
     """Tests for acceptance rate scoring"""
 
-    def test_acceptance_rate_scoring(self, sample_high_acceptance_underwriter, sample_fast_underwriter):
+    def test_acceptance_rate_scoring(self, engine, sample_high_acceptance_underwriter, sample_fast_underwriter):
         """Higher acceptance rate should score higher"""
-        engine = RoutingEngine()
-
         high_score = engine._score_acceptance_rate(sample_high_acceptance_underwriter)
         low_score = engine._score_acceptance_rate(sample_fast_underwriter)
 
         assert high_score > low_score, "Higher acceptance rate underwriter should score higher"
 
-    def test_acceptance_rate_values(self, sample_high_acceptance_underwriter):
+    def test_acceptance_rate_values(self, engine, sample_high_acceptance_underwriter):
         """Verify acceptance rate scoring produces expected values"""
-        engine = RoutingEngine()
-
         # 92% acceptance rate should score very high
         score = engine._score_acceptance_rate(sample_high_acceptance_underwriter)
         assert score >= 0.9, "92% acceptance rate should score >= 0.9"
@@ -535,9 +745,8 @@ class TestAcceptanceRateScoring:
 class TestRecommendationSorting:
     """Tests for recommendation sorting and ranking"""
 
-    def test_recommendations_sorted_by_score(self, sample_mapped_output):
+    def test_recommendations_sorted_by_score(self, engine, sample_mapped_output):
         """Top recommendation should have highest score"""
-        engine = RoutingEngine()
         underwriters = get_all_underwriters()
 
         recommendations = engine.get_recommendations(sample_mapped_output, underwriters)
@@ -549,10 +758,9 @@ class TestRecommendationSorting:
             assert recommendations[i].total_score >= recommendations[i + 1].total_score, \
                 "Recommendations should be sorted by score descending"
 
-    def test_top_recommendation_is_best_match(self, sample_mapped_output, sample_underwriter,
+    def test_top_recommendation_is_best_match(self, engine, sample_mapped_output, sample_underwriter,
                                                sample_construction_underwriter):
         """Bar specialist should be ranked above construction specialist for bar"""
-        engine = RoutingEngine()
 
         recommendations = engine.get_recommendations(
             sample_mapped_output,
@@ -563,45 +771,83 @@ class TestRecommendationSorting:
         assert recommendations[0].underwriter.id == sample_underwriter.id, \
             "Bar specialist should be top recommendation for bar"
 
+    def test_engine_routes_against_injected_panel(self, sample_mapped_output):
+        """An engine built with a panel only recommends from that panel"""
+        panel = get_underwriters_by_naics("541511")
+        recommendations = RoutingEngine(panel).get_recommendations(sample_mapped_output, top_n=5)
+
+        assert {rec.recommended_underwriter.name for rec in recommendations} == {uw.name for uw in panel}
+        assert RoutingEngine([]).get_recommendations(sample_mapped_output) == []
+
+
+class TestColumnScoring:
+    """Tests for column-wise (struct-of-arrays) underwriter scoring"""
+
+    def test_columns_align_with_underwriters(self):
+        """Row i of every column should describe underwriter i"""
+        columns = build_underwriter_soa()
+        underwriters = get_all_underwriters()
+
+        assert len(columns.underwriters) == len(underwriters)
+        for i, uw in enumerate(underwriters):
+            assert columns.regions[i] == uw.region
+            assert columns.acceptance_rates[i] == uw.acceptance_rate
+
+    def test_module_columns_shared_and_frozen(self):
+        """The shared column view covers the database and cannot be reassigned"""
+        assert UNDERWRITER_COLUMNS is underwriter_db.get_underwriter_columns()
+        assert UNDERWRITER_COLUMNS.underwriters == tuple(get_all_underwriters())
+        with pytest.raises(ValidationError):
+            UNDERWRITER_COLUMNS.regions = ()
+
+    @pytest.mark.parametrize("region,naics_code,business_type", [
+        ("Southeast", "722410", "bar"),
+        ("West", "541511", None),
+        (None, "722499", "restaurant"),
+        ("Southeast", "721110", None),
+    ])
+    def test_column_totals_match_per_underwriter_scores(self, engine, region, naics_code, business_type):
+        """Column scoring must agree exactly with score_underwriter"""
+        profile = RiskProfile(region=region, naics_code=naics_code, business_type=business_type)
+
+        totals = engine.score_columns(build_underwriter_soa(), profile)
+        expected = [engine.score_underwriter(uw, profile).total_score for uw in get_all_underwriters()]
+
+        assert totals == expected
+
 
 class TestJustificationGeneration:
     """Tests for recommendation justification"""
 
-    def test_justification_contains_key_info(self, sample_mapped_output, sample_underwriter):
+    def test_justification_contains_key_info(self, engine, sample_mapped_output, sample_underwriter):
         """Justification should mention region, turnaround, and acceptance rate"""
-        engine = RoutingEngine()
-
         recommendations = engine.get_recommendations(sample_mapped_output, [sample_underwriter])
         assert len(recommendations) > 0
 
-        justification = recommendations[0].justification.lower()
+        justification = recommendations[0].justification
 
         # Should mention key factors
-        assert any(word in justification for word in ["southeast", "region", "south carolina", "sc"]), \
-            "Justification should mention region match"
-        assert any(word in justification for word in ["turnaround", "day", "quick", "fast"]), \
-            "Justification should mention turnaround time"
-        assert any(word in justification for word in ["acceptance", "rate", "percent", "%"]), \
-            "Justification should mention acceptance rate"
-
-    def test_justification_mentions_specialty(self, sample_mapped_output, sample_underwriter):
-        """Justification should mention specialty match"""
-        engine = RoutingEngine()
+        assert _JUST_REGION_RE.search(justification), "Justification should mention region match"
+        assert _JUST_TURNAROUND_RE.search(justification), "Justification should mention turnaround time"
+        assert _JUST_ACCEPTANCE_RE.search(justification), "Justification should mention acceptance rate"
 
+    def test_justification_mentions_specialty(self, engine, sample_mapped_output, sample_underwriter):
+        """Justification should mention specialty match"""
         recommendations = engine.get_recommendations(sample_mapped_output, [sample_underwriter])
-        justification = recommendations[0].justification.lower()
+        justification = recommendations[0].justification
 
         # Should mention specialty match
-        assert any(word in justification for word in ["bar", "tavern", "hospitality", "722410", "specialty"]), \
-            "Justification should mention specialty match"
+        assert _JUST_SPECIALTY_RE.search(justification), "Justification should mention specialty match"
 
 
 class TestRoutingResult:
     """Tests for the complete routing result"""
 
-    def test_routing_result_structure(self, sample_mapped_output):
+    def test_routing_result_structure(self, engine, sample_mapped_output):
         """Verify routing result has correct structure"""
-        engine = RoutingEngine()
+        # Not defined by routing_engine yet; imported here so the module still collects
+        from routing_engine import RoutingResult
+
         underwriters = get_all_underwriters()
 
         result = engine.route(sample_mapped_output, underwriters)
@@ -611,9 +857,11 @@ class TestRoutingResult:
         assert hasattr(result, "recommendations")
         assert hasattr(result, "top_recommendation")
 
-    def test_routing_result_has_top_recommendation(self, sample_mapped_output):
+    def test_routing_result_has_top_recommendation(self, engine, sample_mapped_output):
         """Verify routing result includes top recommendation"""
-        engine = RoutingEngine()
+        # Not defined by routing_engine yet; imported here so the module still collects
+        from routing_engine import UnderwriterRecommendation
+
         underwriters = get_all_underwriters()
 
         result = engine.route(sample_mapped_output, underwriters)
@@ -621,19 +869,22 @@ class TestRoutingResult:
         assert result.top_recommendation is not None
         assert isinstance(result.top_recommendation, UnderwriterRecommendation)
 
-    def test_routing_result_scores_are_valid(self, sample_mapped_output):
+    def test_routing_result_scores_are_valid(self, engine, sample_mapped_output):
         """Verify all scores are in valid range (0-100)"""
-        engine = RoutingEngine()
         underwriters = get_all_underwriters()
 
         result = engine.route(sample_mapped_output, underwriters)
 
-        for rec in result.recommendations:
-            assert 0 <= rec.total_score <= 100, f"Total score {rec.total_score} out of range"
-            assert 0 <= rec.region_score <= 1, f"Region score {rec.region_score} out of range"
-            assert 0 <= rec.specialty_score <= 1, f"Specialty score {rec.specialty_score} out of range"
-            assert 0 <= rec.turnaround_score <= 1, f"Turnaround score {rec.turnaround_score} out of range"
-            assert 0 <= rec.acceptance_score <= 1, f"Acceptance score {rec.acceptance_score} out of range"
+        totals = [rec.total_score for rec in result.recommendations]
+        sub_scores = [
+            (rec.region_score, rec.specialty_score, rec.turnaround_score, rec.acceptance_score)
+            for rec in result.recommendations
+        ]
+
+        # One pass per bound; the messages are only built if an assertion fails
+        assert all(0 <= total <= 100 for total in totals), f"Total scores out of range: {totals}"
+        assert all(0 <= score <= 1 for row in sub_scores for score in row), \
+            f"Sub-scores (region, specialty, turnaround, acceptance) out of range: {sub_scores}"
 
 
 # =============================================================================
@@ -641,11 +892,14 @@ class TestRoutingResult:
 # =============================================================================
 
 @pytest.mark.integration
+@pytest.mark.serial
 class TestFullPipelineIntegration:
     """Integration tests for the complete Phase 1-3 pipeline"""
 
-    def test_full_pipeline_phase1_to_phase3(self, sample_transcript):
+    def test_full_pipeline_phase1_to_phase3(self, engine, sample_transcript):
         """End-to-end: transcript -> extraction -> mapping -> routing"""
+        from extract import extract_from_transcript
+
         # Phase 1: Extract
         extraction = extract_from_transcript(sample_transcript)
         assert extraction is not None
@@ -657,7 +911,6 @@ class TestFullPipelineIntegration:
         assert mapped_output.accord_125.business.naics_code is not None
 
         # Phase 3: Route
-        engine = RoutingEngine()
         underwriters = get_all_underwriters()
         result = engine.route(mapped_output, underwriters)
 
@@ -667,24 +920,19 @@ class TestFullPipelineIntegration:
         assert result.top_recommendation is not None
         assert result.top_recommendation.justification is not None
 
-    def test_bar_routes_to_bar_specialist(self, sample_mapped_output):
+    def test_bar_routes_to_bar_specialist(self, engine, sample_mapped_output):
         """The Rusty Anchor should route to bar specialist"""
-        engine = RoutingEngine()
         underwriters = get_all_underwriters()
 
         result = engine.route(sample_mapped_output, underwriters)
         top_rec = result.top_recommendation
 
         # Top recommendation should be a bar/hospitality specialist
-        assert any(
-            "722410" in top_rec.underwriter.naics_specialties or
-            "bar" in str(top_rec.underwriter.business_type_specialties).lower() or
-            "hospitality" in str(top_rec.underwriter.notes).lower()
-        ), f"Top recommendation should be bar specialist, got {top_rec.underwriter.name}"
+        assert "bar" in top_rec.underwriter.specialty_tags, \
+            f"Top recommendation should be bar specialist, got {top_rec.underwriter.name}"
 
-    def test_southeast_routes_to_southeast_underwriter(self, sample_mapped_output):
+    def test_southeast_routes_to_southeast_underwriter(self, engine, sample_mapped_output):
         """Charleston, SC should prefer Southeast underwriter"""
-        engine = RoutingEngine()
         underwriters = get_all_underwriters()
 
         result = engine.route(sample_mapped_output, underwriters)
@@ -697,11 +945,8 @@ class TestFullPipelineIntegration:
             for r in regions_lower
         ), f"Top recommendation should cover Southeast, got regions: {top_rec.underwriter.regions}"
 
-    def test_high_alcohol_triggers_liquor_liability_consideration(self, sample_mapped_output):
+    def test_high_alcohol_triggers_liquor_liability_consideration(self, engine, profile, sample_mapped_output):
         """Bar with 70% alcohol should be routed considering liquor liability"""
-        engine = RoutingEngine()
-        profile = engine.extract_risk_profile(sample_mapped_output)
-
         assert profile.liquor_liability_required is True
         assert profile.alcohol_percentage == 70.0
 
@@ -716,11 +961,8 @@ class TestFullPipelineIntegration:
             for word in ["alcohol", "liquor", "bar", "tavern", "drinking"]
         ), "Justification should consider liquor liability"
 
-    def test_live_entertainment_captured_in_profile(self, sample_mapped_output):
+    def test_live_entertainment_captured_in_profile(self, profile):
         """Live entertainment hazard should be captured in risk profile"""
-        engine = RoutingEngine()
-        profile = engine.extract_risk_profile(sample_mapped_output)
-
         hazards_lower = [h.lower() for h in profile.hazards]
         has_entertainment = any(
             "entertainment" in h or "piano" in h or "music" in h
@@ -733,49 +975,37 @@ class TestFullPipelineIntegration:
 class TestEdgeCases:
     """Integration tests for edge cases"""
 
-    def test_empty_underwriter_list_returns_empty_recommendations(self, sample_mapped_output):
+    def test_empty_underwriter_list_returns_empty_recommendations(self, engine, sample_mapped_output):
         """Routing with no underwriters should return empty recommendations"""
-        engine = RoutingEngine()
         result = engine.route(sample_mapped_output, [])
 
         assert len(result.recommendations) == 0
         assert result.top_recommendation is None
 
-    def test_missing_naics_still_routes(self, sample_mapped_output):
+    def test_missing_naics_still_routes(self, engine, sample_mapped_output):
         """Routing should work even with missing NAICS code"""
         # Remove NAICS code
-        sample_mapped_output.accord_125.business.naics_code = None
-        sample_mapped_output.accord_126.classification.class_code = None
+        mapped_output = sample_mapped_output.model_copy(deep=True)
+        mapped_output.accord_125.business.naics_code = None
+        mapped_output.accord_126.classification.class_code = None
 
-        engine = RoutingEngine()
         underwriters = get_all_underwriters()
 
         # Should not raise exception
-        result = engine.route(sample_mapped_output, underwriters)
+        result = engine.route(mapped_output, underwriters)
 
         assert result is not None
         assert len(result.recommendations) > 0
 
-    def test_routing_handles_partial_address(self, sample_mapped_output):
+    def test_routing_handles_partial_address(self, engine, sample_mapped_output):
         """Routing should work with partial address information"""
         # Remove city
-        sample_mapped_output.accord_125.premises.city = None
+        mapped_output = sample_mapped_output.model_copy(deep=True)
+        mapped_output.accord_125.premises.city = None
 
-        engine = RoutingEngine()
         underwriters = get_all_underwriters()
 
         # Should not raise exception
-        result = engine.route(sample_mapped_output, underwriters)
+        result = engine.route(mapped_output, underwriters)
 
         assert result is not None
-
-
-# =============================================================================
-# PYTEST CONFIGURATION
-# =============================================================================
-
-def pytest_configure(config):
-    """Register custom markers"""
-    config.addinivalue_line(
-        "markers", "integration: marks tests as integration tests (may require full pipeline)"
-    )
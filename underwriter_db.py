@@ -3,11 +3,20 @@ Underwriter Database Module - Phase 3 of Computational Broker Engine
 
 This module provides Pydantic models for underwriter data and a mock database
 of underwriters with helper functions for querying by region and NAICS code.
+The database is static: it is read from underwriter_db.json on first use, and
+the query helpers return shared, immutable tuples that are indexed or memoized.
+They used to return a fresh list per call; callers that need to edit a result
+copy it first.
 """
 
+import sys
+from collections import Counter
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, Field
+from functools import cache, lru_cache, wraps
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Sequence
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, ValidationInfo, field_validator
 
 
 class Region(str, Enum):
@@ -27,195 +36,337 @@ class Workload(str, Enum):
     HIGH = "High"
 
 
+# Ordering of workload levels, lightest first
+_WORKLOAD_RANK = {Workload.LOW: 1, Workload.MEDIUM: 2, Workload.HIGH: 3}
+
+# Specialty tags and what earns them:
+# (NAICS prefixes, lowercased appetite substrings, lowercased notes substrings)
+SPECIALTY_TAG_RULES = {
+    "bar": (("7224",), ("bar", "tavern", "nightclub"), ()),
+    "hospitality": (("72",), ("restaurant", "hotel"), ("hospitality",)),
+    "tech": (("5415", "5182"), ("tech", "software", "saas"), ()),
+    "manufacturing": (("31", "32", "33"), ("manufacturing",), ()),
+    "agriculture": (("11",), ("agricultur",), ("agricultur",)),
+}
+
+
+def _derive_tags(naics_specialties, appetite_lc, notes: Optional[str]) -> frozenset[str]:
+    """Evaluate SPECIALTY_TAG_RULES once for one underwriter's fields."""
+    notes_lc = (notes or "").lower()
+    return frozenset(
+        tag
+        for tag, (prefixes, appetite_words, notes_words) in SPECIALTY_TAG_RULES.items()
+        if any(code.startswith(prefixes) for code in naics_specialties)
+        or any(word in appetite for word in appetite_words for appetite in appetite_lc)
+        or any(word in notes_lc for word in notes_words)
+    )
+
+
+# Validation context key for the flyweight pool _load_db() passes in, so equal
+# appetite, aversion and specialty collections are stored once per load
+_POOL_KEY = "collection_pool"
+
+
+def _share(values, context):
+    """Return the pooled instance equal to values, or values itself outside a load."""
+    pool = context.get(_POOL_KEY) if isinstance(context, dict) else None
+    if pool is None:
+        return values
+    return pool.setdefault(values, values)
+
+
 class Underwriter(BaseModel):
     """
     Pydantic model representing an insurance underwriter.
 
+    Instances are frozen: database rows are read-only and hashable once built.
+
     Attributes:
         name: Full name of the underwriter.
         email: Professional email address.
         phone: Contact phone number.
         region: Geographic region of coverage.
-        risk_appetite: List of risk types the underwriter prefers.
-        risk_aversions: List of risk types the underwriter avoids.
-        naics_specialties: List of NAICS codes the underwriter specializes in.
-        avg_turnaround_days: Average days to process a submission.
+        risk_appetite: Risk types the underwriter prefers.
+        risk_aversions: Risk types the underwriter avoids.
+        naics_specialties: NAICS codes the underwriter specializes in, primary first.
+        avg_turnaround_days: Average days to process a submission (0.5 to 30.0).
         acceptance_rate: Historical acceptance rate (0.0 to 1.0).
         current_workload: Current workload level.
         notes: Optional additional notes about the underwriter.
     """
+    model_config = ConfigDict(frozen=True)
+
     name: str
     email: str
     phone: str
     region: Region
-    risk_appetite: list[str] = Field(description="Risk types the underwriter LIKES")
-    risk_aversions: list[str] = Field(description="Risk types the underwriter AVOIDS")
-    naics_specialties: list[str] = Field(description="NAICS codes of specialization")
+    risk_appetite: tuple[str, ...] = Field(description="Risk types the underwriter LIKES")
+    risk_aversions: tuple[str, ...] = Field(description="Risk types the underwriter AVOIDS")
+    naics_specialties: tuple[str, ...] = Field(description="NAICS codes of specialization")
     avg_turnaround_days: float = Field(ge=0.5, le=30.0)
     acceptance_rate: float = Field(ge=0.0, le=1.0)
     current_workload: Workload
     notes: Optional[str] = None
 
+    # Lookup keys precomputed once so queries are a single hash probe
+    _region_lc: str = PrivateAttr(default="")
+    _naics_set: frozenset[str] = PrivateAttr(default_factory=frozenset)
+    _appetite_lc: frozenset[str] = PrivateAttr(default_factory=frozenset)
+    _aversions_lc: frozenset[str] = PrivateAttr(default_factory=frozenset)
+    _workload_rank: int = PrivateAttr(default=0)
+    _specialty_tags: frozenset[str] = PrivateAttr(default_factory=frozenset)
+
+    @field_validator("naics_specialties", mode="after")
+    @classmethod
+    def _intern_naics(cls, codes: tuple[str, ...], info: ValidationInfo) -> tuple[str, ...]:
+        """Intern specialty codes so index keys and routed codes share one object."""
+        return _share(tuple(sys.intern(code) for code in codes), info.context)
+
+    @field_validator("risk_appetite", "risk_aversions", mode="after")
+    @classmethod
+    def _intern_risk_types(cls, risk_types: tuple[str, ...], info: ValidationInfo) -> tuple[str, ...]:
+        """Intern risk type names and share identical lists across rows."""
+        return _share(tuple(sys.intern(risk_type) for risk_type in risk_types), info.context)
+
+    def model_post_init(self, __context) -> None:
+        """Derive the lookup keys used by the query helpers and scoring, and the specialty tags."""
+        self._region_lc = self.region.value.lower()
+        self._naics_set = frozenset(self.naics_specialties)
+        self._workload_rank = _WORKLOAD_RANK[self.current_workload]
+        self._appetite_lc = frozenset(a.lower() for a in self.risk_appetite)
+        self._aversions_lc = frozenset(a.lower() for a in self.risk_aversions)
+        self._specialty_tags = _share(
+            _derive_tags(self.naics_specialties, self._appetite_lc, self.notes), __context
+        )
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> "Underwriter":
+        """Copy the row, re-deriving the lookup keys when fields are updated."""
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            copy.model_post_init(None)
+        return copy
+
+    @property
+    def specialty_tags(self) -> frozenset[str]:
+        """Specialty tags (e.g. 'bar', 'hospitality') derived once from the row."""
+        return self._specialty_tags
+
+
+# =============================================================================
+# Database Loading
+# =============================================================================
 
 # Mock database of 10 underwriters with realistic data
-UNDERWRITER_DATABASE: list[Underwriter] = [
-    Underwriter(
-        name="Sarah Mitchell",
-        email="sarah.mitchell@insureco.com",
-        phone="(404) 555-1234",
-        region=Region.SOUTHEAST,
-        risk_appetite=["Bars", "Restaurants", "Nightclubs", "Taverns"],
-        risk_aversions=["Heavy Manufacturing", "Mining"],
-        naics_specialties=["722410", "722511", "722513"],  # Drinking places, Full-service restaurants
-        avg_turnaround_days=2.5,
-        acceptance_rate=0.82,
-        current_workload=Workload.MEDIUM,
-        notes="15 years experience in hospitality sector. Prefers detailed loss runs."
-    ),
-    Underwriter(
-        name="Michael Chen",
-        email="m.chen@pacificuw.com",
-        phone="(206) 555-5678",
-        region=Region.PNW,
-        risk_appetite=["Technology", "Software", "Professional Services"],
-        risk_aversions=["Bars", "Nightclubs", "Cannabis"],
-        naics_specialties=["541511", "541512", "541519"],  # Computer systems design
-        avg_turnaround_days=1.5,
-        acceptance_rate=0.88,
-        current_workload=Workload.LOW,
-        notes="Fast turnaround for tech companies. Requires cyber liability details."
-    ),
-    Underwriter(
-        name="Jennifer Rodriguez",
-        email="jrodriguez@sunbeltins.com",
-        phone="(305) 555-9012",
-        region=Region.SOUTHEAST,
-        risk_appetite=["Restaurants", "Hotels", "Retail"],
-        risk_aversions=["Construction", "Roofing"],
-        naics_specialties=["722511", "721110", "445110"],  # Restaurants, Hotels, Grocery
-        avg_turnaround_days=3.0,
-        acceptance_rate=0.79,
-        current_workload=Workload.HIGH,
-        notes="Bilingual (English/Spanish). Strong relationships with Florida markets."
-    ),
-    Underwriter(
-        name="David Thompson",
-        email="david.t@midwestmutual.com",
-        phone="(312) 555-3456",
-        region=Region.MIDWEST,
-        risk_appetite=["Manufacturing", "Warehousing", "Distribution"],
-        risk_aversions=["Bars", "Adult Entertainment"],
-        naics_specialties=["332999", "493110", "484110"],  # Manufacturing, Warehousing, Trucking
-        avg_turnaround_days=4.0,
-        acceptance_rate=0.71,
-        current_workload=Workload.MEDIUM,
-        notes="Extensive experience with product liability. Prefers face-to-face meetings."
-    ),
-    Underwriter(
-        name="Amanda Foster",
-        email="afoster@eastcoastuw.com",
-        phone="(212) 555-7890",
-        region=Region.NORTHEAST,
-        risk_appetite=["Retail", "Professional Services", "Medical Offices"],
-        risk_aversions=["Heavy Construction", "Hazardous Materials"],
-        naics_specialties=["448140", "541110", "621111"],  # Retail, Legal, Medical
-        avg_turnaround_days=2.0,
-        acceptance_rate=0.85,
-        current_workload=Workload.LOW,
-        notes="Quick responses. Specializes in small to mid-market accounts."
-    ),
-    Underwriter(
-        name="Robert Garcia",
-        email="rgarcia@desertuw.com",
-        phone="(602) 555-2345",
-        region=Region.SOUTHWEST,
-        risk_appetite=["Bars", "Restaurants", "Entertainment Venues"],
-        risk_aversions=["Mining", "Oil & Gas"],
-        naics_specialties=["722410", "722511", "713940"],  # Drinking places, Restaurants, Fitness centers
-        avg_turnaround_days=3.5,
-        acceptance_rate=0.76,
-        current_workload=Workload.MEDIUM,
-        notes="Strong liquor liability experience. Familiar with Arizona/Nevada regulations."
-    ),
-    Underwriter(
-        name="Lisa Park",
-        email="lpark@goldengate.com",
-        phone="(415) 555-6789",
-        region=Region.WEST,
-        risk_appetite=["Technology Startups", "SaaS", "Fintech"],
-        risk_aversions=["Heavy Manufacturing", "Agriculture"],
-        naics_specialties=["541511", "522320", "518210"],  # Tech, Financial services, Data processing
-        avg_turnaround_days=1.0,
-        acceptance_rate=0.92,
-        current_workload=Workload.HIGH,
-        notes="Fastest turnaround in the region. Premium pricing but high acceptance rate."
-    ),
-    Underwriter(
-        name="James Wilson",
-        email="jwilson@atlanticins.com",
-        phone="(617) 555-0123",
-        region=Region.NORTHEAST,
-        risk_appetite=["Construction", "Contractors", "Real Estate"],
-        risk_aversions=["Restaurants", "Bars"],
-        naics_specialties=["236220", "238210", "531210"],  # Construction, Electrical, Real estate
-        avg_turnaround_days=5.0,
-        acceptance_rate=0.68,
-        current_workload=Workload.LOW,
-        notes="Conservative underwriter. Thorough review process but reliable approvals."
-    ),
-    Underwriter(
-        name="Maria Santos",
-        email="msantos@heartlanduw.com",
-        phone="(816) 555-4567",
-        region=Region.MIDWEST,
-        risk_appetite=["Agriculture", "Food Processing", "Retail"],
-        risk_aversions=["Nightclubs", "Cannabis"],
-        naics_specialties=["111998", "311999", "445110"],  # Agriculture, Food manufacturing, Grocery
-        avg_turnaround_days=4.5,
-        acceptance_rate=0.73,
-        current_workload=Workload.MEDIUM,
-        notes="Deep expertise in agricultural risks. Familiar with crop insurance programs."
-    ),
-    Underwriter(
-        name="Kevin O'Brien",
-        email="kobrien@peachstateuw.com",
-        phone="(770) 555-8901",
-        region=Region.SOUTHEAST,
-        risk_appetite=["Restaurants", "Bars", "Breweries", "Wineries"],
-        risk_aversions=["Heavy Industry", "Chemical Processing"],
-        naics_specialties=["722410", "722511", "312120", "312130"],  # Bars, Restaurants, Breweries
-        avg_turnaround_days=2.0,
-        acceptance_rate=0.87,
-        current_workload=Workload.LOW,
-        notes="Hospitality specialist. Great for craft beverage accounts. Very responsive."
-    ),
-]
-
-
-def get_all_underwriters() -> list[Underwriter]:
+DATABASE_PATH = Path(__file__).with_name("underwriter_db.json")
+
+_UNDERWRITER_LIST = TypeAdapter(list[Underwriter])
+
+
+@cache
+def _load_db() -> tuple[Underwriter, ...]:
+    """Parse and validate the underwriter database on first use."""
+    # The pool only lives for this load, so rows built later never grow it
+    pool: dict = {}
+    return tuple(
+        _UNDERWRITER_LIST.validate_json(DATABASE_PATH.read_bytes(), context={_POOL_KEY: pool})
+    )
+
+
+def __getattr__(name: str):
+    """Resolve the lazily loaded module-level views on first access."""
+    if name == "UNDERWRITER_DATABASE":
+        return _load_db()
+    if name == "UNDERWRITER_COLUMNS":
+        return get_underwriter_columns()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Lowercased region values accepted by get_underwriters_by_region
+_REGIONS_LC = frozenset(r.value.lower() for r in Region)
+_VALID_REGIONS_MSG = f"Valid regions: {[r.value for r in Region]}"
+
+
+@lru_cache(maxsize=None)
+def _parse_region(region: str) -> str:
+    """Normalize a region name to its lowercased index key, memoized per spelling."""
+    region_lc = region.strip().lower()
+    if region_lc not in _REGIONS_LC:
+        raise ValueError(f"Invalid region '{region}'. {_VALID_REGIONS_MSG}")
+    return region_lc
+
+
+def _build_index(keys_of) -> MappingProxyType:
+    """Group the database by every key keys_of(uw) yields, keeping database order.
+
+    The result is a read-only mapping of key to a tuple of underwriters.
+    """
+    index: dict[str, list[Underwriter]] = {}
+    for uw in _load_db():
+        for key in keys_of(uw):
+            index.setdefault(key, []).append(uw)
+    return MappingProxyType({key: tuple(group) for key, group in index.items()})
+
+
+# Inverse indexes built on first query, so region and NAICS queries are a
+# single dict lookup instead of a scan of the database
+@cache
+def _region_index() -> MappingProxyType:
+    """Lowercased region to underwriters."""
+    return _build_index(lambda uw: (uw._region_lc,))
+
+
+@cache
+def _naics_index() -> MappingProxyType:
+    """NAICS specialty code to underwriters."""
+    return _build_index(lambda uw: uw._naics_set)
+
+
+# Prefix lengths indexed for broader NAICS matching (sector, subsector,
+# industry group, national industry)
+NAICS_PREFIX_LEVELS = (2, 3, 4, 6)
+
+
+@cache
+def _naics_prefix_index() -> MappingProxyType:
+    """Prefix length to (NAICS prefix to underwriters)."""
+    return MappingProxyType({
+        level: _build_index(lambda uw, level=level: {code[:level] for code in uw.naics_specialties})
+        for level in NAICS_PREFIX_LEVELS
+    })
+
+
+def _scan_appetite(risk_type_lower: str) -> list[Underwriter]:
+    """Underwriters with an appetite containing risk_type_lower, in database order."""
+    # Exact matches hit the set directly; only misses fall back to a substring scan
+    return [
+        uw for uw in _load_db()
+        if risk_type_lower in uw._appetite_lc
+        or any(risk_type_lower in appetite for appetite in uw._appetite_lc)
+    ]
+
+
+@cache
+def _appetite_index() -> MappingProxyType:
+    """
+    Every lowercased appetite and each of its words, mapped to the full
+    substring match for that token, so common appetite queries skip the scan.
+    """
+    return MappingProxyType({
+        token: tuple(_scan_appetite(token))
+        for uw in _load_db()
+        for appetite in uw._appetite_lc
+        for token in (appetite, *appetite.split())
+    })
+
+
+# =============================================================================
+# Query Selectivity
+# =============================================================================
+
+# Calls and surviving rows per query helper, recorded only while tracking is on
+_SELECTIVITY_CALLS: Counter = Counter()
+_SELECTIVITY_ROWS: Counter = Counter()
+_selectivity_tracking = False
+
+
+def set_selectivity_tracking(enabled: bool) -> None:
+    """
+    Turn per-query selectivity recording on or off (off by default).
+
+    Args:
+        enabled: Whether the query helpers should record calls and result sizes.
+    """
+    global _selectivity_tracking
+    _selectivity_tracking = enabled
+
+
+def reset_selectivity_stats() -> None:
+    """Clear all recorded selectivity counts."""
+    _SELECTIVITY_CALLS.clear()
+    _SELECTIVITY_ROWS.clear()
+
+
+def get_selectivity_stats() -> dict[str, dict[str, float]]:
+    """
+    Report how selective each query helper has been while tracking was on.
+
+    Selectivity is the average fraction of the database a call returned, so
+    the lowest value is the predicate that prunes the most rows and should
+    be applied first when combining filters.
+
+    Returns:
+        Query name to {"calls", "rows", "selectivity"}, most selective first.
+
+    Example:
+        >>> set_selectivity_tracking(True)
+        >>> _ = get_underwriters_by_naics("722410")
+        >>> get_selectivity_stats()["get_underwriters_by_naics"]["calls"]
+        1
+    """
+    total = len(_load_db())
+    stats = {
+        name: {
+            "calls": calls,
+            "rows": _SELECTIVITY_ROWS[name],
+            "selectivity": _SELECTIVITY_ROWS[name] / (calls * total) if total else 0.0,
+        }
+        for name, calls in _SELECTIVITY_CALLS.items()
+    }
+    return dict(sorted(stats.items(), key=lambda item: item[1]["selectivity"]))
+
+
+def _tracked(query):
+    """Record calls and result sizes for a query helper while tracking is on."""
+    name = query.__name__
+
+    @wraps(query)
+    def wrapper(*args, **kwargs):
+        result = query(*args, **kwargs)
+        if _selectivity_tracking:
+            _SELECTIVITY_CALLS[name] += 1
+            _SELECTIVITY_ROWS[name] += len(result)
+        return result
+
+    # Keep lru_cache introspection reachable on memoized helpers
+    for attr in ("cache_info", "cache_clear"):
+        if hasattr(query, attr):
+            setattr(wrapper, attr, getattr(query, attr))
+    return wrapper
+
+
+def get_all_underwriters(copy: bool = False) -> Sequence[Underwriter]:
     """
     Retrieve all underwriters from the database.
 
+    Args:
+        copy: Return a new mutable list instead of the shared tuple.
+
     Returns:
-        list[Underwriter]: Complete list of all underwriters in the database.
+        Sequence[Underwriter]: All underwriters in the database, as a shared
+            tuple (or a fresh list when copy is True).
 
     Example:
         >>> underwriters = get_all_underwriters()
         >>> len(underwriters)
         10
     """
-    return UNDERWRITER_DATABASE.copy()
+    if copy:
+        return list(_load_db())
+    return _load_db()
 
 
-def get_underwriters_by_region(region: Region | str) -> list[Underwriter]:
+@_tracked
+def get_underwriters_by_region(region: Region | str) -> tuple[Underwriter, ...]:
     """
     Retrieve underwriters filtered by geographic region.
 
     Args:
-        region: The region to filter by. Can be a Region enum or string value.
+        region: The region to filter by. Can be a Region enum or string value
+            (matched case-insensitively).
 
     Returns:
-        list[Underwriter]: List of underwriters covering the specified region.
+        tuple[Underwriter, ...]: Underwriters covering the specified region
+            (shared; served straight from the region index).
 
     Raises:
         ValueError: If the region string doesn't match any valid region.
@@ -225,17 +376,17 @@ def get_underwriters_by_region(region: Region | str) -> list[Underwriter]:
         >>> len(southeast_uw) >= 2
         True
     """
-    if isinstance(region, str):
-        try:
-            region = Region(region)
-        except ValueError:
-            valid_regions = [r.value for r in Region]
-            raise ValueError(f"Invalid region '{region}'. Valid regions: {valid_regions}")
-
-    return [uw for uw in UNDERWRITER_DATABASE if uw.region == region]
+    if isinstance(region, Region):
+        region_lc = region.value.lower()
+    elif isinstance(region, str):
+        region_lc = _parse_region(region)
+    else:
+        raise ValueError(f"Invalid region {region!r}. {_VALID_REGIONS_MSG}")
+    return _region_index().get(region_lc, ())
 
 
-def get_underwriters_by_naics(naics_code: str) -> list[Underwriter]:
+@_tracked
+def get_underwriters_by_naics(naics_code: str) -> tuple[Underwriter, ...]:
     """
     Retrieve underwriters who specialize in a given NAICS code.
 
@@ -243,17 +394,64 @@ def get_underwriters_by_naics(naics_code: str) -> list[Underwriter]:
         naics_code: The NAICS code to search for (e.g., "722410" for drinking places).
 
     Returns:
-        list[Underwriter]: List of underwriters specializing in the given NAICS code.
+        tuple[Underwriter, ...]: Underwriters specializing in the given NAICS code
+            (shared; served straight from the NAICS index).
 
     Example:
         >>> bar_specialists = get_underwriters_by_naics("722410")
         >>> len(bar_specialists) >= 2
         True
     """
-    return [uw for uw in UNDERWRITER_DATABASE if naics_code in uw.naics_specialties]
+    return _naics_index().get(naics_code, ())
 
 
-def get_underwriters_by_risk_appetite(risk_type: str) -> list[Underwriter]:
+@_tracked
+def get_underwriters_by_naics_prefix(
+    naics_code: str,
+    levels: Sequence[int] = (6, 4, 2),
+) -> tuple[Underwriter, ...]:
+    """
+    Retrieve specialists for a NAICS code, widening to broader prefixes.
+
+    Tries each prefix length in turn and returns the first non-empty match,
+    so a code with no exact specialist falls back to its industry group and
+    then its sector.
+
+    Args:
+        naics_code: The NAICS code to search for (e.g., "722410").
+        levels: Prefix lengths to try, tightest first. Each must be one of
+            NAICS_PREFIX_LEVELS.
+
+    Returns:
+        tuple[Underwriter, ...]: Underwriters in the tightest matching bucket,
+            or an empty tuple if no level matches.
+
+    Raises:
+        ValueError: If naics_code is not a string, or a level is not an
+            indexed prefix length.
+
+    Example:
+        >>> [uw.name for uw in get_underwriters_by_naics_prefix("722999")][:1]
+        ['Sarah Mitchell']
+    """
+    if not isinstance(naics_code, str):
+        raise ValueError(f"Invalid NAICS code {naics_code!r}. Expected a string such as '722410'")
+
+    index = _naics_prefix_index()
+    for level in levels:
+        if level not in index:
+            raise ValueError(f"Invalid NAICS prefix level {level}. Valid levels: {list(NAICS_PREFIX_LEVELS)}")
+        if len(naics_code) < level:
+            continue
+        matches = index[level].get(naics_code[:level])
+        if matches:
+            return matches
+    return ()
+
+
+@_tracked
+@lru_cache(maxsize=128)
+def get_underwriters_by_risk_appetite(risk_type: str) -> tuple[Underwriter, ...]:
     """
     Retrieve underwriters who have appetite for a specific risk type.
 
@@ -261,7 +459,8 @@ def get_underwriters_by_risk_appetite(risk_type: str) -> list[Underwriter]:
         risk_type: The type of risk to search for (e.g., "Bars", "Restaurants").
 
     Returns:
-        list[Underwriter]: List of underwriters with appetite for the risk type.
+        tuple[Underwriter, ...]: Underwriters with appetite for the risk type
+            (memoized per query string).
 
     Example:
         >>> restaurant_uw = get_underwriters_by_risk_appetite("Restaurants")
@@ -269,13 +468,15 @@ def get_underwriters_by_risk_appetite(risk_type: str) -> list[Underwriter]:
         True
     """
     risk_type_lower = risk_type.lower()
-    return [
-        uw for uw in UNDERWRITER_DATABASE
-        if any(risk_type_lower in appetite.lower() for appetite in uw.risk_appetite)
-    ]
+    indexed = _appetite_index().get(risk_type_lower)
+    if indexed is not None:
+        return indexed
+    return tuple(_scan_appetite(risk_type_lower))
 
 
-def get_available_underwriters(max_workload: Workload = Workload.MEDIUM) -> list[Underwriter]:
+@_tracked
+@lru_cache(maxsize=None)
+def get_available_underwriters(max_workload: Workload = Workload.MEDIUM) -> tuple[Underwriter, ...]:
     """
     Retrieve underwriters with workload at or below the specified level.
 
@@ -283,40 +484,93 @@ def get_available_underwriters(max_workload: Workload = Workload.MEDIUM) -> list
         max_workload: Maximum acceptable workload level. Defaults to Medium.
 
     Returns:
-        list[Underwriter]: List of underwriters with acceptable workload levels.
+        tuple[Underwriter, ...]: Underwriters with acceptable workload levels
+            (memoized per workload level).
 
     Example:
         >>> available = get_available_underwriters(Workload.LOW)
         >>> all(uw.current_workload == Workload.LOW for uw in available)
         True
     """
-    workload_order = {Workload.LOW: 1, Workload.MEDIUM: 2, Workload.HIGH: 3}
-    max_level = workload_order[max_workload]
+    max_level = _WORKLOAD_RANK[max_workload]
 
-    return [
-        uw for uw in UNDERWRITER_DATABASE
-        if workload_order[uw.current_workload] <= max_level
-    ]
+    return tuple(
+        uw for uw in _load_db()
+        if uw._workload_rank <= max_level
+    )
 
 
-if __name__ == "__main__":
-    # Demo usage
-    print("=== Underwriter Database Demo ===\n")
+class UnderwriterColumns(BaseModel):
+    """
+    Struct-of-arrays view of a list of underwriters.
+
+    Each attribute is a tuple with one entry per underwriter, so row ``i`` of
+    every column describes ``underwriters[i]``. Scoring code can then walk one
+    attribute at a time instead of visiting every field of every object.
 
-    print(f"Total underwriters: {len(get_all_underwriters())}\n")
+    Attributes:
+        underwriters: The underwriters the columns were built from.
+        regions: Region of each underwriter.
+        naics_specialties: NAICS specialty codes of each underwriter.
+        risk_appetite: Risk types each underwriter prefers.
+        risk_aversions: Risk types each underwriter avoids.
+        risk_aversions_lc: Lowercased aversion set of each underwriter.
+        avg_turnaround_days: Average turnaround of each underwriter.
+        acceptance_rates: Historical acceptance rate of each underwriter.
+        workloads: Current workload of each underwriter.
+    """
+    model_config = ConfigDict(frozen=True)
 
-    print("Southeast Region Underwriters:")
-    for uw in get_underwriters_by_region(Region.SOUTHEAST):
-        print(f"  - {uw.name} ({uw.email}) - Acceptance Rate: {uw.acceptance_rate:.0%}")
+    underwriters: tuple[Underwriter, ...]
+    regions: tuple[Region, ...]
+    naics_specialties: tuple[tuple[str, ...], ...]
+    risk_appetite: tuple[tuple[str, ...], ...]
+    risk_aversions: tuple[tuple[str, ...], ...]
+    risk_aversions_lc: tuple[frozenset[str], ...]
+    avg_turnaround_days: tuple[float, ...]
+    acceptance_rates: tuple[float, ...]
+    workloads: tuple[Workload, ...]
 
-    print("\nBar/Restaurant Specialists (NAICS 722410):")
-    for uw in get_underwriters_by_naics("722410"):
-        print(f"  - {uw.name} - Turnaround: {uw.avg_turnaround_days} days")
 
-    print("\nUnderwriters with 'Restaurants' appetite:")
-    for uw in get_underwriters_by_risk_appetite("Restaurants"):
-        print(f"  - {uw.name} ({uw.region.value})")
+def build_underwriter_soa(underwriters: Optional[Sequence[Underwriter]] = None) -> UnderwriterColumns:
+    """
+    Build a column-oriented view of the underwriter database.
 
-    print("\nAvailable Underwriters (Low workload):")
-    for uw in get_available_underwriters(Workload.LOW):
-        print(f"  - {uw.name} - Acceptance Rate: {uw.acceptance_rate:.0%}")
+    Args:
+        underwriters: Underwriters to lay out. Defaults to the full database.
+
+    Returns:
+        UnderwriterColumns with one tuple per underwriter attribute.
+
+    Example:
+        >>> columns = build_underwriter_soa()
+        >>> len(columns.regions) == len(get_all_underwriters())
+        True
+    """
+    if underwriters is None:
+        underwriters = _load_db()
+
+    return UnderwriterColumns.model_construct(
+        underwriters=tuple(underwriters),
+        regions=tuple(uw.region for uw in underwriters),
+        naics_specialties=tuple(uw.naics_specialties for uw in underwriters),
+        risk_appetite=tuple(uw.risk_appetite for uw in underwriters),
+        risk_aversions=tuple(uw.risk_aversions for uw in underwriters),
+        risk_aversions_lc=tuple(uw._aversions_lc for uw in underwriters),
+        avg_turnaround_days=tuple(uw.avg_turnaround_days for uw in underwriters),
+        acceptance_rates=tuple(uw.acceptance_rate for uw in underwriters),
+        workloads=tuple(uw.current_workload for uw in underwriters),
+    )
+
+
+@cache
+def get_underwriter_columns() -> UnderwriterColumns:
+    """
+    Column view of the full database, built once on first use.
+
+    Also available as the module attribute UNDERWRITER_COLUMNS.
+
+    Returns:
+        The shared UnderwriterColumns for every underwriter in the database.
+    """
+    return build_underwriter_soa()
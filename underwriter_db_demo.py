@@ -0,0 +1,43 @@
+"""
+Underwriter Database Demo - Phase 3 of Computational Broker Engine
+
+Prints sample queries against the mock underwriter database. Kept out of
+underwriter_db.py so the library module stays import-only.
+"""
+
+from underwriter_db import (
+    Region,
+    Workload,
+    get_all_underwriters,
+    get_available_underwriters,
+    get_underwriters_by_naics,
+    get_underwriters_by_region,
+    get_underwriters_by_risk_appetite,
+)
+
+
+def main():
+    """Run the underwriter database demo queries"""
+    print("=== Underwriter Database Demo ===\n")
+
+    print(f"Total underwriters: {len(get_all_underwriters())}\n")
+
+    print("Southeast Region Underwriters:")
+    for uw in get_underwriters_by_region(Region.SOUTHEAST):
+        print(f"  - {uw.name} ({uw.email}) - Acceptance Rate: {uw.acceptance_rate:.0%}")
+
+    print("\nBar/Restaurant Specialists (NAICS 722410):")
+    for uw in get_underwriters_by_naics("722410"):
+        print(f"  - {uw.name} - Turnaround: {uw.avg_turnaround_days} days")
+
+    print("\nUnderwriters with 'Restaurants' appetite:")
+    for uw in get_underwriters_by_risk_appetite("Restaurants"):
+        print(f"  - {uw.name} ({uw.region.value})")
+
+    print("\nAvailable Underwriters (Low workload):")
+    for uw in get_available_underwriters(Workload.LOW):
+        print(f"  - {uw.name} - Acceptance Rate: {uw.acceptance_rate:.0%}")
+
+
+if __name__ == "__main__":
+    main()